@@ -0,0 +1,140 @@
+import os
+import io
+import csv
+import glob
+import time
+import argparse
+import statistics
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+
+# --- POLICIES ---
+# "idle"             no input at all
+# "random[:seed]"    simulation.RandomBot, reseeded per run
+# "script:<file>"    simulation.ScriptedInput from a JSON script
+# "replay:<file>"    the actions of a recorded session (replay.py), always played on the
+#                    level and seed from its header, whatever the job's level and seed
+
+def make_input(policy, run_seed):
+    import simulation
+    kind, _, arg = policy.partition(":")
+    if kind == "idle":
+        return simulation.ScriptedInput()
+    if kind == "random":
+        base = int(arg) if arg else 0
+        return simulation.RandomBot(base * 1000003 + run_seed)
+    if kind == "script":
+        return simulation.ScriptedInput.load(arg)
+    if kind == "replay":
+        import replay
+        return replay.Replay.load(arg)
+    raise ValueError(f"Unknown policy '{policy}'")
+
+def run_job(job):
+    """Worker: one headless game. Must stay a top-level function so it can be pickled."""
+    level, policy, run_seed, max_ticks = job
+    import simulation
+    from game import Game
+
+    # Games print a lot of DEBUG lines, keep worker output quiet
+    with contextlib.redirect_stdout(io.StringIO()):
+        input_source = make_input(policy, run_seed)
+        if policy.startswith("replay:"):
+            # A recording only reproduces on the level and seed it was made with
+            level, run_seed = input_source.level, input_source.seed
+        game = Game(level, headless=True, seed=run_seed)
+        result = simulation.run_headless(level, input_source, max_ticks, game=game)
+
+    times = result.pop("tick_times")
+    result["policy"] = policy
+    result["seed"] = run_seed
+    result["avg_tick_ms"] = 1000 * sum(times) / len(times) if times else 0
+    return result
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def summarize(results):
+    """Groups run results per (level, policy) into one row of score / order distributions."""
+    groups = {}
+    for r in results:
+        groups.setdefault((r["level"], r["policy"]), []).append(r)
+
+    rows = []
+    for (level, policy), runs in sorted(groups.items()):
+        scores = [r["score"] for r in runs]
+        orders = [r["orders_completed"] for r in runs]
+        rows.append({
+            "level": level,
+            "policy": policy,
+            "runs": len(runs),
+            "score_mean": round(statistics.mean(scores), 2),
+            "score_stdev": round(statistics.pstdev(scores), 2),
+            "score_min": min(scores),
+            "score_p10": percentile(scores, 10),
+            "score_p50": percentile(scores, 50),
+            "score_p90": percentile(scores, 90),
+            "score_max": max(scores),
+            "orders_mean": round(statistics.mean(orders), 2),
+            "orders_min": min(orders),
+            "orders_p50": percentile(orders, 50),
+            "orders_max": max(orders),
+            "finished_pct": round(100 * sum(r["game_over"] for r in runs) / len(runs), 1),
+            "ticks_mean": round(statistics.mean(r["ticks"] for r in runs), 1),
+            "avg_tick_ms": round(statistics.mean(r["avg_tick_ms"] for r in runs), 4),
+        })
+    return rows
+
+def write_table(rows, path):
+    if not rows: return
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+def main():
+    from simulation import DEFAULT_MAX_TICKS
+
+    parser = argparse.ArgumentParser(description="Simulate levels headless across all cores and tabulate results.")
+    parser.add_argument("levels", nargs="+", help="Level files or glob patterns")
+    parser.add_argument("--policy", action="append", help="Input policy, repeatable (default: random)")
+    parser.add_argument("--runs", type=int, default=20, help="Runs per level and policy")
+    parser.add_argument("--ticks", type=int, default=DEFAULT_MAX_TICKS, help="Max ticks per run")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed, run i uses seed + i")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes")
+    parser.add_argument("--out", default="batch_results.csv", help="Results table (CSV)")
+    args = parser.parse_args()
+
+    levels = []
+    for pattern in args.levels:
+        levels.extend(sorted(glob.glob(pattern)) or [pattern])
+    policies = args.policy or ["random"]
+
+    # Replays bring their own level, so they run once rather than once per level
+    replays = [p for p in policies if p.startswith("replay:")]
+    jobs = [(level, policy, args.seed + i, args.ticks)
+            for level in levels for policy in policies if policy not in replays for i in range(args.runs)]
+    jobs += [(None, policy, args.seed + i, args.ticks) for policy in replays for i in range(args.runs)]
+    print(f"Running {len(jobs)} games on {args.workers} workers...")
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        chunk = max(1, len(jobs) // (args.workers * 4))
+        results = list(pool.map(run_job, jobs, chunksize=chunk))
+    elapsed = time.perf_counter() - start
+
+    rows = summarize(results)
+    write_table(rows, args.out)
+
+    simulated = sum(r["ticks"] for r in results)
+    print(f"Simulated {simulated} ticks in {elapsed:.1f}s "
+          f"({simulated / max(elapsed, 1e-9) / 60 / 60:.1f} game minutes per second)")
+    for row in rows:
+        print(f"{row['level']} [{row['policy']}] score {row['score_mean']} +/- {row['score_stdev']}, "
+              f"orders {row['orders_mean']}")
+    print(f"Results written to {args.out}")
+
+if __name__ == "__main__":
+    main()
@@ -67,5 +67,20 @@ class Controls:
         self.actions = DEFAULT_CONTROLS.copy()
         self.save()
 
+class ActionState:
+    """
+    Stand-in for pygame.key.get_pressed() built from action names.
+    Used by scripted / headless input so is_active() works unchanged.
+    """
+    def __init__(self, actions=(), controls=None):
+        controls = controls or manager
+        self.actions = frozenset(actions)
+        self.key_codes = set()
+        for action in self.actions:
+            self.key_codes.update(controls.get_keys(action))
+
+    def __getitem__(self, key_code):
+        return key_code in self.key_codes
+
 # Global instance
 manager = Controls()
@@ -1,5 +1,5 @@
-import json
-import os
+import gamedata
+from symbols import SYMBOLS, contents
 
 class CookingManager:
     """
@@ -9,13 +9,13 @@ class CookingManager:
     def __init__(self, container_name, game_data=None):
         self.container_name = container_name
         
-        # Load data if not provided
+        # Shared registry data unless a specific gamedata.GameData is passed in
         if game_data is None:
-            self.game_data = self._load_data()
+            self.game_data = gamedata.get()
         else:
             self.game_data = game_data
 
-        self.contents = [] # List of ingredient names
+        self.contents = contents() # Symbol codes of what is in the container
         self.state = "IDLE" # IDLE, COOKING, COOKED, BURNT
         
         # Progress Tracking
@@ -25,20 +25,45 @@ class CookingManager:
         self.burn_progress = 0
         self.burn_limit = 0 # Calculated burn time
 
+        # Change signals: version moves on every state / contents change (the container
+        # only redraws then), the percentages are kept up to date for progress bars
+        self.version = 0
+        self.progress_pct = 0.0
+        self.burn_pct = 0.0
+
         # Cache container stats
-        c_data = self.game_data.get("containers", {}).get(container_name, {})
-        self.min_items = c_data.get("min_items", 1)
-        self.max_items = c_data.get("max_items", 3)
-        self.visual_type = c_data.get("visual_type", container_name)
+        self._load_container_stats()
+
+    def _load_container_stats(self):
+        c_data = self.game_data.container(self.container_name)
+        self.min_items = c_data.min_items
+        self.max_items = c_data.max_items
+        self.visual_type = c_data.visual_type
+
+    def apply_data(self, game_data):
+        """
+        Hot reload: switch to a new gamedata.GameData without losing what is cooking.
+        Limits and cook / burn times are re-derived, current progress is kept.
+        """
+        self.game_data = game_data
+        self._load_container_stats()
+        self._recalculate_requirements()
+        self.changed()
 
-    def _load_data(self):
-        if os.path.exists('gamedata.json'):
-            with open('gamedata.json', 'r') as f:
-                return json.load(f)
-        return {"ingredients": {}, "containers": {}, "recipes": {}}
+    def changed(self):
+        """Call after changing state, contents or progress from outside tick()."""
+        self.version += 1
+        self.update_progress()
+
+    def update_progress(self):
+        # Same fallbacks as the CookingContainer properties (0 = not worked out yet)
+        target = self.target_progress if self.target_progress > 0 else 100
+        self.progress_pct = min(1.0, self.current_progress / target)
+        limit = self.burn_limit if self.burn_limit > 0 else 100
+        self.burn_pct = min(1.0, self.burn_progress / limit)
 
     def can_add(self, ingredient_name):
-        """Check if ingredient can be added to this container."""
+        """Check if ingredient (by name) can be added to this container."""
         if self.state == "BURNT":
             return False
         
@@ -46,11 +71,11 @@ class CookingManager:
             return False
 
         # Check compatibility
-        ing_data = self.game_data.get("ingredients", {}).get(ingredient_name, {})
+        ing_data = self.game_data.ingredient(ingredient_name)
         # If specific container required, strict check. 
         # Otherwise default to 'pot' or generic behavior.
         # User Logic: "ingredients should tell which containers they can be cooked in"
-        req_cont = ing_data.get("container_type", "pot")
+        req_cont = ing_data.container_type
         
         # Logic from previous objects.py (simplified and corrected):
         # If container is generic "container", it accepts everything (debug/map editor feature maybe?)
@@ -67,7 +92,7 @@ class CookingManager:
         if not self.can_add(ingredient_name):
             return False
 
-        self.contents.append(ingredient_name)
+        self.contents.append(SYMBOLS.code(ingredient_name))
         
         # Recalculate Requirements
         self._recalculate_requirements()
@@ -85,6 +110,7 @@ class CookingManager:
             # For simplicity, if we add something, we just ensure we are in COOKING mode 
             # and let the new total time dictate the percentage.
         
+        self.changed()
         return True
 
     def _recalculate_requirements(self):
@@ -110,10 +136,10 @@ class CookingManager:
         
         found_burn_times = []
         
-        for item in self.contents:
-            data = self.game_data.get("ingredients", {}).get(item, {})
-            total_cook += data.get("cook_time", 100) # Default 100
-            found_burn_times.append(data.get("burn_time", 100))
+        for code in self.contents:
+            data = self.game_data.ingredient(SYMBOLS.names[code])
+            total_cook += data.cook_time # Default 100
+            found_burn_times.append(data.burn_time)
             
         self.target_progress = total_cook
         if found_burn_times:
@@ -126,13 +152,16 @@ class CookingManager:
         Advance cooking state by 'amount' ticks.
         """
         if not self.contents:
-            self.state = "IDLE"
-            self.current_progress = 0
+            if self.state != "IDLE" or self.current_progress:
+                self.state = "IDLE"
+                self.current_progress = 0
+                self.changed()
             return
 
         # If we are IDLE but have contents, -> COOKING
         if self.state == "IDLE":
              self.state = "COOKING"
+             self.version += 1
 
         if self.state == "COOKING":
             self.current_progress += amount
@@ -140,17 +169,21 @@ class CookingManager:
                 self.state = "COOKED"
                 self.current_progress = self.target_progress # Cap it
                 self.burn_progress = 0 # Start burn timer
+                self.version += 1
         
         elif self.state == "COOKED":
             self.burn_progress += amount
             if self.burn_progress >= self.burn_limit:
                 self.state = "BURNT"
-                self.contents = ["burnt_sludge"] # Ruin food
+                self.contents = SYMBOLS.encode(["burnt_sludge"]) # Ruin food
+                self.version += 1
+
+        self.update_progress()
 
     def get_progress_percent(self):
         if self.state == "COOKING":
             if self.target_progress == 0: return 0
-            return min(1.0, self.current_progress / self.target_progress)
+            return self.progress_pct
         elif self.state == "COOKED":
              # Maybe show burn progress?
              return 1.0
@@ -159,5 +192,5 @@ class CookingManager:
     def get_burn_percent(self):
         if self.state == "COOKED":
             if self.burn_limit == 0: return 0
-            return min(1.0, self.burn_progress / self.burn_limit)
+            return self.burn_pct
         return 0.0
@@ -0,0 +1,81 @@
+import os
+import json
+import pickle
+import hashlib
+
+# --- COMPILED DATA CACHE ---
+# gamedata.json and level files are parsed and normalised (legacy formats migrated)
+# once, then kept as pickles under CACHE_DIR. The next load of an unchanged file
+# unpickles the compiled document instead of parsing JSON and migrating it again.
+# A cache entry is only used if path, mtime, size and SCHEMA_VERSION all match, so
+# editing a file (or changing a normaliser below) simply recompiles it.
+
+CACHE_DIR = ".cache"
+SCHEMA_VERSION = 3 # Bump whenever a normaliser or compiled class changes what it produces
+
+DEFAULT_RECIPE_TIME = [1800, 2400] # Order time range for recipes listed without one
+DEFAULT_CONFIG = {
+    "mode": "time_limit",
+    "time_limit": 180,
+    "star_thresholds": [100, 300, 500]
+}
+
+def cache_path(path, kind):
+    key = hashlib.sha1(f"{kind}:{os.path.abspath(path)}".encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, f"{kind}-{key}.pickle")
+
+def load(path, kind, normalise=None):
+    """
+    The normalised document in `path` and the sha1 of the file it came from.
+    Raises OSError if the file can't be read and ValueError if it isn't valid JSON.
+    """
+    st = os.stat(path)
+    stamp = (SCHEMA_VERSION, os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    cached = cache_path(path, kind)
+
+    try:
+        with open(cached, 'rb') as f:
+            header = pickle.load(f)
+            if header["stamp"] == stamp:
+                return pickle.load(f), header["sha1"]
+    except (OSError, EOFError, KeyError, pickle.UnpicklingError, AttributeError, TypeError):
+        pass # Missing or stale cache, compile below
+
+    with open(path, 'rb') as f:
+        content = f.read()
+    document = json.loads(content)
+    if normalise: document = normalise(document)
+    sha1 = hashlib.sha1(content).hexdigest()
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{cached}.{os.getpid()}.tmp" # Batch workers may compile the same file at once
+        with open(tmp, 'wb') as f:
+            pickle.dump({"stamp": stamp, "sha1": sha1}, f, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(document, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cached)
+    except OSError as e:
+        print(f"WARNING: could not write data cache for {path}: {e}")
+    return document, sha1
+
+# --- LEVEL FILES ---
+
+def normalise_recipes(recipes):
+    """Level recipe config as {name: [min_ticks, max_ticks]}. Old levels list names only."""
+    if isinstance(recipes, list):
+        return {name: list(DEFAULT_RECIPE_TIME) for name in recipes}
+    return dict(recipes or {})
+
+def normalise_level(data):
+    """Migrates any level format to {"objects": [...], "recipes": {...}, "config": {...}}."""
+    if isinstance(data, list): # Oldest format: just the object list
+        data = {"objects": data}
+    data["objects"] = data.get("objects", [])
+    data["recipes"] = normalise_recipes(data.get("recipes"))
+    if "config" not in data: data["config"] = dict(DEFAULT_CONFIG)
+    return data
+
+def load_level(path):
+    """A level file, migrated to the current format (see normalise_level)."""
+    document, _ = load(path, "level", normalise_level)
+    return document
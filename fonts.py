@@ -0,0 +1,63 @@
+import pygame
+from collections import OrderedDict
+
+# --- SHARED FONTS ---
+# pygame.font.SysFont goes through fontconfig on every call, which costs milliseconds.
+# Every font the game uses comes from get_font() instead: each (family, size, bold)
+# is resolved once per process and the Font object is shared by everyone.
+# Fonts are read-only once made, so sharing them is safe.
+
+FONTS = {}
+
+def get_font(family="Arial", size=20, bold=False):
+    """The shared Font for (family, size, bold). pygame.font must be initialised."""
+    key = (family, size, bold)
+    font = FONTS.get(key)
+    if font is None:
+        font = pygame.font.SysFont(family, size, bold=bold)
+        FONTS[key] = font
+    return font
+
+# --- RENDERED TEXT CACHE ---
+# Most UI strings ("Score: 120", ticket names, menu items) are the same from one
+# frame to the next. render_text() keeps the last TEXT_CACHE_SIZE rendered surfaces
+# and hands the same one back instead of rasterising the string again.
+# Surfaces handed out here are SHARED: blit them, never draw on them.
+
+TEXT_CACHE_SIZE = 256
+
+class TextCache:
+    def __init__(self, size=TEXT_CACHE_SIZE):
+        self.size = size
+        self.surfaces = OrderedDict() # (font, text, color, antialias) -> Surface, oldest first
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.size:
+            self.surfaces.popitem(last=False) # Drop the least recently used
+        return surface
+
+    def stats(self):
+        """(hits, misses, cached surfaces), for debugging frame times."""
+        return self.hits, self.misses, len(self.surfaces)
+
+    def clear(self):
+        self.surfaces.clear()
+        self.hits = self.misses = 0
+
+TEXT_CACHE = TextCache()
+
+def render_text(font, text, color, antialias=True):
+    """font.render(text, antialias, color) through the shared LRU cache."""
+    return TEXT_CACHE.render(font, text, color, antialias)
@@ -2,38 +2,75 @@ import pygame
 import sys
 import json
 import os
+import time
+import random
 from player import Player
 from level import Level
-from objects import Counter, Stove, Ingredient, CookingContainer, Plate, PhysicsEntity, Crate, Container, ServingCounter, Sink, Processor
-from orders import OrderManager
-from orders import OrderManager
+from objects import Counter, Stove, Ingredient, CookingContainer, Plate, PhysicsEntity, Crate, ServingCounter, Sink, Processor
+from orders import DEFAULT_MAX_ORDERS, OrderManager
 from ui import UIManager
+from timers import TimerScheduler
+from spatial import SpatialGroup, ItemGroup, nearest_interactable
+from symbols import SYMBOLS
 import controls
+import interactions
+import gamedata
+import datacache
+import surfaces
 
 # --- VIEWPORT CONSTANTS ---
 GAME_WIDTH = 800
 GAME_HEIGHT = 600
 UI_HEIGHT = 120 
+TICKS_PER_SECOND = 60
+FIXED_DT = 1.0 / TICKS_PER_SECOND
+MAX_STEPS_PER_FRAME = 5 # Catch-up cap, prevents the spiral of death on slow machines
+MAX_FRAME_TIME = 0.25 # Longer stalls (window drag, breakpoint) are not replayed
+RENDER_FPS = 60
+UI_FPS = 30 # Top bar refresh rate while playing, may be lower than the simulation
+DATA_CHECK_INTERVAL = 1.0 # Seconds between gamedata.json hot reload checks
+# Key presses are queued and applied at the start of the next logic step, in this order
+ONE_SHOT_ACTIONS = ("throw", "interact")
 
 class Game:
-    def __init__(self, level_path):
+    def __init__(self, level_path, headless=False, dirty_rects=True, seed=None):
+        if headless:
+            # Never opens a window, keep SDL from looking for a display
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
         pygame.init()
         self.level_path = level_path
+        self.headless = headless
+        # All gameplay randomness comes from self.rng so sessions can be replayed
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.recorder = None # replay.SessionRecorder, if this session is being recorded
+        # Only push changed screen regions to the display (see draw_dirty)
+        self.dirty_rects = dirty_rects
+        self.full_redraw = True
+        self.drawn_rects = [] # Canvas regions covered by sprites/bars last frame
+        self.info_rect = None # Screen region of the selection info box last frame
         self.screen_width = GAME_WIDTH
         self.screen_height = GAME_HEIGHT + UI_HEIGHT
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
-        level_name = os.path.basename(level_path).split('.')[0]
-        pygame.display.set_caption(f"Overcooked Clone - {level_name}")
+        if headless:
+            # No window: the game is stepped from outside (see simulation.py)
+            self.screen = None
+        else:
+            self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+            level_name = os.path.basename(level_path).split('.')[0]
+            pygame.display.set_caption(f"Overcooked Clone - {level_name}")
         self.game_canvas = pygame.Surface((GAME_WIDTH, GAME_HEIGHT))
         self.clock = pygame.time.Clock()
         self.running = True
         self.level = Level(GAME_WIDTH, GAME_HEIGHT)
         self.all_sprites = pygame.sprite.Group()
-        self.walls = pygame.sprite.Group()
-        self.items = pygame.sprite.Group()
+        self.walls = SpatialGroup() # Grid-indexed: stations never move
+        self.items = ItemGroup()
+        self.active_stations = pygame.sprite.Group() # Stations with work to do, see Counter.has_work
+        self.version = 0 # Bumped when the game mode / game over state changes (the UI caches on it)
         self.new()
 
     def new(self):
+        self.version += 1
         self.selected_object = None
         player_spawn_pos = (100, 300)
         level_recipes_data = {} 
@@ -43,23 +80,21 @@ class Game:
         self.game_timer = 0
         self.game_time_limit = 0
         self.elapsed_time = 0
+        self.ticks = 0
+        self.rng = random.Random(self.seed)
+        self.timers = TimerScheduler() # Plate returns, order spawns and other deadlines
+        self.pending_actions = set()
+        self.prev_positions = {}
         self.start_ticks = pygame.time.get_ticks()
+        gamedata.refresh() # Re-parsed only if gamedata.json changed since the last level
         
         if os.path.exists(self.level_path):
             print(f"Loading map from {self.level_path}...")
             try:
-                with open(self.level_path, 'r') as f:
-                    data = json.load(f)
-                if isinstance(data, list):
-                    object_list = data
-                else:
-                    object_list = data.get("objects", [])
-                    level_recipes_data = data.get("recipes", {})
-                    self.game_config = data.get("config", {
-                        "mode": "time_limit", 
-                        "time_limit": 180, 
-                        "star_thresholds": [100, 300, 500]
-                    })
+                data = datacache.load_level(self.level_path) # Legacy formats already migrated
+                object_list = data["objects"]
+                level_recipes_data = data["recipes"]
+                self.game_config = data["config"]
                 
                 # Init Game State based on config
                 self.game_mode = self.game_config.get("mode", "time_limit")
@@ -73,41 +108,34 @@ class Game:
 
                 # Load Game Data for Dynamic Containers
                 valid_containers = ["plate"]
-                if os.path.exists('gamedata.json'):
-                    try:
-                        with open('gamedata.json', 'r') as gf:
-                            gdata = json.load(gf)
-                            valid_containers.extend(gdata.get("containers", {}).keys())
-                    except:
-                        pass
+                valid_containers.extend(gamedata.get().containers.keys())
                 
                 for item in object_list:
                     x, y = item["x"], item["y"]
                     obj_type = item["type"]
                     
                     if obj_type == "counter":
-                        obj = Counter(x, y); self.walls.add(obj); self.all_sprites.add(obj)
+                        obj = Counter(x, y); self.add_station(obj)
                     elif obj_type == "cutting_board":
-                        obj = Processor(x, y, "cutting_board"); self.walls.add(obj); self.all_sprites.add(obj)
+                        obj = Processor(x, y, "cutting_board"); self.add_station(obj)
                     elif obj_type == "stove":
-                        obj = Stove(x, y); self.walls.add(obj); self.all_sprites.add(obj)
+                        obj = Stove(x, y); self.add_station(obj)
                     elif obj_type == "processor":
                         p_type = item.get("args", "stove")
-                        obj = Processor(x, y, p_type); self.walls.add(obj); self.all_sprites.add(obj)
+                        obj = Processor(x, y, p_type); self.add_station(obj)
                     elif obj_type == "serving_counter":
-                        obj = ServingCounter(x, y); self.walls.add(obj); self.all_sprites.add(obj)
+                        obj = ServingCounter(x, y); self.add_station(obj)
                     elif obj_type == "sink":
-                        obj = Sink(x, y); self.walls.add(obj); self.all_sprites.add(obj)
+                        obj = Sink(x, y); self.add_station(obj)
                     elif obj_type == "crate":
-                        ing = item.get("args", "onion"); obj = Crate(x, y, ing); self.walls.add(obj); self.all_sprites.add(obj)
+                        ing = item.get("args", "onion"); obj = Crate(x, y, ing); self.add_station(obj)
                     elif obj_type == "spawn_point":
                         player_spawn_pos = (x, y)
                     elif obj_type in valid_containers or obj_type == "container":
                         if obj_type == "plate": obj = Plate(0, 0)
                         else: obj = CookingContainer(obj_type, 0, 0)
                         
-                        d = pygame.sprite.Sprite(); d.rect = pygame.Rect(x, y, 40, 40)
-                        h = pygame.sprite.spritecollide(d, self.walls, False)
+                        h = self.walls.collide(pygame.Rect(x, y, 40, 40))
                         if h: obj.snap_to_counter(h[0])
                         else: obj.rect.topleft = (x, y)
                         self.items.add(obj); self.all_sprites.add(obj)
@@ -115,77 +143,145 @@ class Game:
         else: print(f"WARNING: {self.level_path} not found!")
         self.player = Player(player_spawn_pos[0], player_spawn_pos[1])
         self.all_sprites.add(self.player)
-        self.order_manager = OrderManager(level_recipes_data)
-        self.ui_manager = UIManager(self.order_manager, self)
+        self.order_manager = OrderManager(level_recipes_data, self.rng, self.timers,
+                                          self.game_config.get("max_orders", DEFAULT_MAX_ORDERS))
+        self.items.recipe_index = self.order_manager.recipe_index # Plates only take what this level's recipes can use
+        self.ui_manager = UIManager(self.order_manager, self, refresh_ticks=TICKS_PER_SECOND // UI_FPS)
+        if not self.headless:
+            self.level.build_background(self.walls)
 
     def run(self):
+        # Fixed timestep: logic always advances in FIXED_DT steps (catching up
+        # several per frame under load), rendering interpolates between steps.
+        accumulator = 0.0
+        previous = time.perf_counter()
+        next_data_check = previous + DATA_CHECK_INTERVAL
         while self.running:
+            now = time.perf_counter()
+            accumulator += min(now - previous, MAX_FRAME_TIME)
+            previous = now
+
+            # Designers tune gamedata.json in the editor while the game runs
+            if now >= next_data_check:
+                next_data_check = now + DATA_CHECK_INTERVAL
+                self.check_gamedata()
+
             self.events()
-            if not self.game_over:
-                self.update()
-            else:
-                # Still allow UI updates or just freeze? 
-                # For now, freeze game logic but allow basic events
-                pass 
-                
-            self.draw()
-            self.clock.tick(60)
+            if not self.running: break
+            steps = 0
+            while accumulator >= FIXED_DT and steps < MAX_STEPS_PER_FRAME:
+                if not self.game_over:
+                    self.snapshot_positions()
+                    self.update()
+                else:
+                    # Logic is frozen, nothing left to interpolate
+                    self.prev_positions = {}
+                accumulator -= FIXED_DT
+                steps += 1
+            if steps == MAX_STEPS_PER_FRAME:
+                # Too far behind: drop the backlog instead of falling further behind
+                accumulator = min(accumulator, FIXED_DT)
+
+            self.draw(accumulator / FIXED_DT)
+            self.clock.tick(RENDER_FPS)
 
     def events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT: self.running = False; sys.exit()
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED): self.full_redraw = True
             if event.type == pygame.KEYDOWN:
-                if event.key in controls.manager.get_keys("pause"): self.running = False; return 
-                if event.key in controls.manager.get_keys("throw"): self.player.throw()
-                if event.key in controls.manager.get_keys("interact"):
-                    held_item = self.player.inventory
-                    target = self.selected_object
-                    real_target = target
-                    if isinstance(target, Counter) and target.held_item: real_target = target.held_item
-                    
-                    if held_item is None and isinstance(target, Crate):
-                        new_item = Ingredient(target.ingredient_name, 0, 0)
-                        self.items.add(new_item); self.all_sprites.add(new_item); self.player.pickup(new_item); return
-                    if isinstance(held_item, Ingredient) and isinstance(real_target, Container):
-                        if real_target.add_ingredient(held_item): held_item.kill(); self.player.inventory = None; return
-                    if isinstance(held_item, Plate) and isinstance(real_target, Container):
-                        if real_target.food_ready:
-                            held_item.add_food(real_target.contents)
-                            real_target.contents = []; real_target.food_ready = False; real_target.cooking_progress = 0
-                            if isinstance(real_target, CookingContainer): real_target.redraw()
-                            return
-                    if isinstance(held_item, Container) and isinstance(real_target, Plate):
-                        if held_item.food_ready and len(real_target.contents) == 0:
-                            real_target.add_food(held_item.contents)
-                            held_item.contents = []; held_item.food_ready = False; held_item.cooking_progress = 0
-                            if isinstance(held_item, CookingContainer): held_item.redraw()
-                            return
-                    if isinstance(held_item, Plate) and isinstance(target, ServingCounter):
-                        if len(held_item.contents) > 0:
-                            self.order_manager.check_delivery(held_item.contents)
-                            held_item.kill(); self.player.inventory = None; target.serve_plate(); return
-                    if isinstance(held_item, Plate) and isinstance(real_target, Plate):
-                        if held_item.is_dirty == real_target.is_dirty and len(held_item.contents) == 0 and len(real_target.contents) == 0:
-                            real_target.stack_count += held_item.stack_count
-                            real_target.redraw_plate()
-                            held_item.kill(); self.player.inventory = None; return
-                    if held_item:
-                        if isinstance(target, Counter) and target.held_item is None: held_item.snap_to_counter(target); self.player.inventory = None
-                        elif target is None: self.player.drop()
-                    else:
-                        if isinstance(target, Counter) and target.held_item:
-                            item = target.held_item
-                            if isinstance(item, Plate) and item.stack_count > 1:
-                                item.stack_count -= 1; item.redraw_plate()
-                                new_plate = Plate(0, 0); 
-                                if item.is_dirty: new_plate.make_dirty()
-                                self.items.add(new_plate); self.all_sprites.add(new_plate); self.player.pickup(new_plate)
-                            else: self.player.pickup(item); target.held_item = None
-                        elif isinstance(target, PhysicsEntity): self.player.pickup(target)
-
-    def update(self):
+                if event.key in controls.manager.get_keys("pause"): self.handle_action("pause"); return 
+                if event.key in controls.manager.get_keys("throw"): self.handle_action("throw")
+                if event.key in controls.manager.get_keys("interact"): self.handle_action("interact")
+
+    def check_gamedata(self):
+        """Hot reload: if gamedata.json changed, patch the live objects instead of restarting."""
+        old = gamedata.get()
+        new = gamedata.refresh()
+        if new is old: return False
+
+        changes = gamedata.diff(old, new)
+        ingredients = changes["ingredients"]
+        surfaces.clear() # Sprite keys carry their colours, this just drops looks nothing uses any more
+        self.order_manager.apply_data(new)
+        self.items.recipe_index = self.order_manager.recipe_index
+        patched = 0
+
+        for item in self.items:
+            if isinstance(item, Ingredient) and item.name in ingredients:
+                item.apply_data(new.ingredient(item.name)); item.redraw()
+                patched += 1
+            elif isinstance(item, CookingContainer):
+                # Cook / burn times come from the ingredients inside
+                if item.name in changes["containers"] or ingredients.intersection(SYMBOLS.decode(item.contents)):
+                    item.apply_data(new)
+                    patched += 1
+
+        for station in self.walls:
+            if isinstance(station, Processor) and station.type_id in changes["processors"]:
+                station.apply_data(new.processor(station.type_id))
+            elif isinstance(station, Crate) and station.ingredient_name in ingredients:
+                station.apply_data(new.ingredients.get(station.ingredient_name))
+            else:
+                continue
+            patched += 1
+            self.level.refresh(station) # Furniture is baked into the background
+
+        changed = {section: sorted(names) for section, names in changes.items() if names}
+        print(f"Hot reload: gamedata.json changed {changed}, patched {patched} objects")
+        return True
+
+    def add_station(self, station):
+        station.active_group = self.active_stations
+        self.walls.add(station); self.all_sprites.add(station)
+        station.refresh_activity()
+
+    def handle_action(self, action):
+        """
+        Takes a one-shot action (a key press). Shared by the live event loop and scripted input.
+        Gameplay actions wait for the next logic step so live play and replays see them at the same tick.
+        """
+        if action == "pause": self.running = False
+        elif action in ONE_SHOT_ACTIONS and not self.game_over: self.pending_actions.add(action)
+
+    def apply_actions(self):
+        actions = [action for action in ONE_SHOT_ACTIONS if action in self.pending_actions]
+        self.pending_actions.clear()
+        for action in actions:
+            if action == "throw": self.player.throw()
+            elif action == "interact": self.interact()
+        return actions
+
+    def interact(self):
+        held_item = self.player.inventory
+        target = self.selected_object
+        # Specific (held, target) rules first, see interactions.py
+        if interactions.dispatch(self, held_item, target): return
+
+        # Otherwise plain place / pick up
+        if held_item:
+            if isinstance(target, Counter) and target.held_item is None: held_item.snap_to_counter(target); self.player.inventory = None
+            elif target is None: self.player.drop()
+        else:
+            if isinstance(target, Counter) and target.held_item:
+                item = target.held_item
+                if isinstance(item, Plate) and item.stack_count > 1:
+                    item.stack_count -= 1; item.redraw()
+                    new_plate = Plate(0, 0); 
+                    if item.is_dirty: new_plate.make_dirty()
+                    self.items.add(new_plate); self.all_sprites.add(new_plate); self.player.pickup(new_plate)
+                else: self.player.pickup(item); target.held_item = None
+            elif isinstance(target, PhysicsEntity): self.player.pickup(target)
+
+    def update(self, keys=None):
         # --- GAME LOGIC ---
-        dt = 1.0 / 60.0 # Aproximated for logic updates if needed
+        dt = FIXED_DT # One logic step, independent of render rate
+        self.ticks += 1
+
+        # Scripted/headless runs pass their own key state
+        if keys is None: keys = pygame.key.get_pressed()
+        actions = self.apply_actions()
+        if self.recorder: self.recorder.record_tick(keys, actions)
         
         if self.game_mode == "time_limit":
             self.game_timer -= dt
@@ -203,39 +299,28 @@ class Game:
                 self.game_over = True
                 self.check_win_condition()
 
-        keys = pygame.key.get_pressed()
         self.player.update(keys, self.walls)
         self.items.update(self.walls)
         self.order_manager.update()
-        for wall in self.walls:
-            if isinstance(wall, ServingCounter): wall.update(self.items, self.all_sprites)
-            else: wall.update()
+        self.timers.advance()
+        # Only stations with work are ticked (idle counters would do nothing)
+        for station in self.active_stations.sprites():
+            if isinstance(station, ServingCounter): station.update(self.items, self.all_sprites)
+            else: station.update()
 
         # --- SELECTION & RESET LOGIC ---
-        if self.selected_object:
-            # RESET EVERYTHING, NOT JUST COUNTERS
-            self.selected_object.reset()
-            self.selected_object = None
-
+        # Everything keeps a normal and a highlighted image, so this is only a pointer
+        # swap, and only when the selection actually moves
+        previous = self.selected_object
         hitbox = self.player.get_interaction_hitbox()
-        temp_sprite = pygame.sprite.Sprite()
-        temp_sprite.rect = hitbox
-        
-        wall_hits = pygame.sprite.spritecollide(temp_sprite, self.walls, False)
-        item_hits = pygame.sprite.spritecollide(temp_sprite, self.items, False)
-        all_hits = wall_hits + item_hits
-        
-        if all_hits:
-            interaction_point = pygame.math.Vector2(hitbox.center)
-            def get_distance(obj): return interaction_point.distance_to(obj.rect.center)
-            closest_obj = min(all_hits, key=get_distance)
-            
-            # Filter flying items
-            if isinstance(closest_obj, PhysicsEntity) and getattr(closest_obj, 'physics_state', '') != "IDLE":
-                pass
-            else:
-                self.selected_object = closest_obj
-                self.selected_object.highlight()
+        self.selected_object = nearest_interactable(hitbox, self.walls, self.items)
+
+        if previous is not self.selected_object:
+            if previous: previous.reset()
+            if self.selected_object: self.selected_object.highlight()
+            # Furniture lives on the cached background, repaint it only when the highlight moves
+            for obj in (previous, self.selected_object):
+                if obj is not None and self.walls.has(obj): self.level.refresh(obj)
 
         if controls.manager.is_active("chop", keys):
             if self.selected_object:
@@ -247,19 +332,88 @@ class Game:
                         if self.player.inventory is None:
                             clean_plate = Plate(0, 0); self.items.add(clean_plate); self.all_sprites.add(clean_plate); self.player.pickup(clean_plate)
 
-    def draw(self):
+    def snapshot_positions(self):
+        """Remembers where moving sprites were before a logic step, for render interpolation."""
+        self.prev_positions = {self.player: self.player.rect.topleft}
+        for item in self.items:
+            if item.physics_state != "IDLE": self.prev_positions[item] = item.rect.topleft
+
+    def draw(self, alpha=1.0):
+        # Draw moving sprites part way between the previous and current step
+        restore = []
+        for sprite, (px, py) in self.prev_positions.items():
+            x, y = sprite.rect.topleft
+            if (px, py) != (x, y):
+                restore.append((sprite, (x, y)))
+                sprite.rect.topleft = (round(px + (x - px) * alpha), round(py + (y - py) * alpha))
+
+        if self.dirty_rects and not self.full_redraw and not self.game_over:
+            self.draw_dirty()
+        else:
+            self.draw_full()
+
+        for sprite, pos in restore: sprite.rect.topleft = pos
+
+    def draw_world(self):
+        """Draws everything that sits on top of the level background. Returns the canvas rects touched."""
+        rects = [self.game_canvas.blit(self.player.image, self.player.rect)]
+        for item in self.items:
+            rects.append(self.game_canvas.blit(item.image, item.rect))
+        for station in self.active_stations:
+            if hasattr(station, "draw_progress_bar"):
+                bar = station.draw_progress_bar(self.game_canvas)
+                if bar: rects.append(bar)
+        return rects
+
+    def draw_full(self):
+        # Furniture is part of the level background, only moving sprites are drawn on top
         self.level.draw(self.game_canvas)
-        self.all_sprites.draw(self.game_canvas)
-        for wall in self.walls:
-            if hasattr(wall, "draw_progress_bar"): wall.draw_progress_bar(self.game_canvas)
+        self.drawn_rects = self.draw_world()
         self.screen.fill((30, 30, 30))
         self.ui_manager.draw(self.screen)
         self.screen.blit(self.game_canvas, (0, UI_HEIGHT))
+        self.info_rect = None
         if self.selected_object:
-            self.ui_manager.draw_selection_info(self.screen, self.selected_object, self.screen_height)
+            self.info_rect = self.ui_manager.draw_selection_info(self.screen, self.selected_object, self.screen_height)
         pygame.display.flip()
+        self.full_redraw = False
+
+    def draw_dirty(self):
+        """
+        Dirty-rect frame: restores the background only where sprites, progress bars
+        or the selection box were last frame, redraws those on top and pushes just
+        the changed regions with display.update().
+        """
+        canvas_area = self.game_canvas.get_rect()
+        background = self.level.background
+
+        # 1. Erase last frame (plus furniture tiles repainted since, e.g. highlight changes)
+        stale = self.drawn_rects + self.level.take_dirty_areas()
+        if self.info_rect: stale.append(self.info_rect.move(0, -UI_HEIGHT))
+        for rect in stale:
+            self.game_canvas.blit(background, rect, rect)
+
+        # 2. Draw this frame
+        self.drawn_rects = self.draw_world()
+
+        # 3. Copy changed canvas regions to the screen
+        updates = []
+        for rect in stale + self.drawn_rects:
+            rect = rect.clip(canvas_area)
+            if rect.width and rect.height:
+                updates.append(self.screen.blit(self.game_canvas, rect.move(0, UI_HEIGHT), rect))
+
+        # 4. Overlays drawn straight onto the screen
+        updates.extend(self.ui_manager.draw(self.screen, force=False))
+        self.info_rect = None
+        if self.selected_object:
+            self.info_rect = self.ui_manager.draw_selection_info(self.screen, self.selected_object, self.screen_height)
+            updates.append(self.info_rect)
+
+        pygame.display.update(updates)
 
     def check_win_condition(self):
+        self.version += 1 # Game over screen
         self.game_won = True # Default to "Finished"
         # You could implement logic here to say "Defeat" if score is 0, but for now
         # Time limit always ends in a "Finish", stars determine quality.
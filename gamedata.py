@@ -0,0 +1,190 @@
+import os
+import datacache
+from recipes import RecipeIndex
+from symbols import SYMBOLS
+
+DATA_FILE = "gamedata.json"
+
+# --- GAMEDATA REGISTRY ---
+# gamedata.json is parsed in one place. Everything else asks for get() and reads
+# typed records instead of digging through the raw JSON dicts.
+# refresh() re-checks the file (mtime and size first, then content hash) and only re-parses
+# when it actually changed, so it is cheap to call at every level load.
+# The compiled GameData is kept in the datacache, so a launch with an unchanged
+# file skips parsing entirely.
+
+SECTIONS = ("ingredients", "containers", "processors", "recipes")
+
+def recipe_signature(ingredients):
+    """Canonical, hashable form of an ingredient multiset (order on the plate doesn't matter)."""
+    return tuple(sorted(ingredients))
+
+class IngredientDef:
+    def __init__(self, name, entry):
+        self.name = name
+        self.color_raw = tuple(entry.get("color_raw", (255, 165, 0)))
+        self.color_chopped = tuple(entry.get("color_chopped", (200, 200, 200)))
+        self.color_cooked = tuple(entry.get("color_cooked", (150, 100, 50)))
+        self.color_burnt = tuple(entry.get("color_burnt", (0, 0, 0)))
+        self.crate_color = tuple(entry.get("crate_color", (100, 100, 100)))
+        self.prepare_time = entry.get("prepare_time", 100)
+        self.cook_time = entry.get("cook_time", 100)
+        self.burn_time = entry.get("burn_time", 100)
+        self.container_type = entry.get("container_type", "pot")
+
+class ContainerDef:
+    def __init__(self, name, entry):
+        self.name = name
+        self.min_items = entry.get("min_items", 1)
+        self.max_items = entry.get("max_items", 3)
+        self.visual_type = entry.get("visual_type", name)
+
+class ProcessorDef:
+    def __init__(self, name, entry):
+        self.name = name
+        self.color = tuple(entry.get("color", (50, 50, 50)))
+        self.process_method = entry.get("process_method", "cook_tick")
+        self.progress_bar_color = tuple(entry.get("progress_bar_color", (0, 255, 0)))
+        self.processing_speed = entry.get("processing_speed", 1.0)
+        self.requires_interaction = entry.get("requires_interaction", False)
+        self.accepted_items = entry.get("accepted_items") # None = accepts anything
+
+class RecipeDef:
+    def __init__(self, name, entry):
+        self.name = name
+        self.ingredients = list(entry.get("ingredients", [])) # Content names, for editors and display
+        self.container = entry.get("container")
+        self.cook_time = entry.get("cook_time")
+        self.link()
+
+    def link(self):
+        # Symbol codes differ between processes, so these are rebuilt after unpickling
+        self.codes = SYMBOLS.encode(self.ingredients)
+        self.signature = recipe_signature(self.codes) # Worked out once per load for delivery matching
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state["codes"], state["signature"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.link()
+
+class GameData:
+    """One parsed gamedata.json. Treat as read-only, it is shared by everything."""
+    def __init__(self, raw=None, loaded=False):
+        self.raw = raw or {}
+        self.loaded = loaded # False if the file was missing or unreadable
+        self.ingredients = {name: IngredientDef(name, e) for name, e in self.raw.get("ingredients", {}).items()}
+        self.containers = {name: ContainerDef(name, e) for name, e in self.raw.get("containers", {}).items()}
+        self.processors = {name: ProcessorDef(name, e) for name, e in self.raw.get("processors", {}).items()}
+        self.recipes = {name: RecipeDef(name, e) for name, e in self.raw.get("recipes", {}).items()}
+        self.link()
+
+    def link(self):
+        # Intern every (ingredient, state) this data knows about
+        for name in self.ingredients:
+            SYMBOLS.code(name, "raw"); SYMBOLS.code(name, "chopped")
+        self._recipe_index = None
+
+    @property
+    def recipe_index(self):
+        """RecipeIndex of every recipe, by symbol code. Built on first use: games use the
+        level's own index (OrderManager.recipe_index), so most loads never need this one."""
+        if self._recipe_index is None:
+            self._recipe_index = RecipeIndex((recipe.name, recipe.codes) for recipe in self.recipes.values())
+        return self._recipe_index
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state["_recipe_index"] # Codes are per process, rebuilt on demand
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.link()
+
+    # Lookups that fall back to the defaults for names the data doesn't know
+    def ingredient(self, name):
+        return self.ingredients.get(name) or IngredientDef(name, {})
+
+    def container(self, name):
+        return self.containers.get(name) or ContainerDef(name, {})
+
+    def processor(self, name):
+        return self.processors.get(name) or ProcessorDef(name, {})
+
+    def recipe(self, name):
+        return self.recipes.get(name) or RecipeDef(name, {})
+
+def compile_data(raw):
+    """datacache compile step: raw JSON -> GameData (missing or malformed sections become empty)."""
+    if not isinstance(raw, dict): raw = {}
+    for section in SECTIONS:
+        if not isinstance(raw.get(section), dict): raw[section] = {}
+    return GameData(raw, loaded=True)
+
+class Registry:
+    def __init__(self, path=DATA_FILE):
+        self.path = path
+        self.stat = None # (mtime, size) of the last successful load
+        self.failed = None # (mtime, size) of the last failed load, reported once
+        self.sha1 = None
+        self.data = None
+        self.version = 0 # Bumped every time the data is actually re-parsed
+
+    def get(self):
+        if self.data is None: self.refresh()
+        return self.data
+
+    def refresh(self):
+        """Re-reads the file if it changed since the last load. Returns the current data."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            if self.data is None or self.stat is not None:
+                self.stat = self.sha1 = None
+                self.set_data(GameData())
+            return self.data
+
+        # Size too: an editor save can truncate and rewrite within one coarse mtime tick
+        stat = (st.st_mtime_ns, st.st_size)
+        if stat == self.stat and self.data is not None: return self.data
+
+        try:
+            data, sha1 = datacache.load(self.path, "gamedata", compile_data)
+            # Only remembered once the file parsed, so a poll that caught a half
+            # written save is retried on the next one
+            self.stat = stat
+            if sha1 == self.sha1 and self.data is not None: return self.data # Touched, not edited
+            self.sha1 = sha1
+            self.set_data(data)
+        except (OSError, ValueError) as e:
+            if stat != self.failed: print(f"Error loading {self.path}: {e}")
+            self.failed = stat
+            if self.data is None: self.set_data(GameData())
+        return self.data
+
+    def set_data(self, data):
+        self.data = data
+        self.version += 1
+
+def diff(old, new):
+    """Per section, the names whose entries were added, removed or changed between two loads."""
+    changes = {}
+    for section in SECTIONS:
+        before = old.raw.get(section, {})
+        after = new.raw.get(section, {})
+        changes[section] = {name for name in before.keys() | after.keys() if before.get(name) != after.get(name)}
+    return changes
+
+REGISTRY = Registry()
+
+def get():
+    """The current gamedata, parsed on first use."""
+    return REGISTRY.get()
+
+def refresh():
+    """Picks up edits to gamedata.json (cheap when nothing changed)."""
+    return REGISTRY.refresh()
@@ -0,0 +1,114 @@
+from objects import Counter, Ingredient, CookingContainer, Plate, Crate, Container, ServingCounter
+
+# --- INTERACTION RULES ---
+# What the interact key does is decided by (what the player holds, what they point at).
+# Rules are registered once and compiled per concrete (held type, target type) pair,
+# so a key press is one dict lookup no matter how many object types mods add.
+#
+# A rule's handler gets (game, held_item, target) and returns True if it handled the
+# press. Returning False lets the next matching rule try; if none does, the game falls
+# back to plain place / pick up (Game.interact).
+#
+# "target" is what sits on the selected counter, or the selection itself when the
+# counter is empty. Rules registered with station=True always get the selected station.
+
+RULES = []
+_compiled = {} # (held type, station type, target type) -> tuple of (handler, station)
+
+class Rule:
+    def __init__(self, held_kind, target_kind, handler, station, priority, order):
+        self.held_kind = held_kind
+        self.target_kind = target_kind
+        self.handler = handler
+        self.station = station
+        self.priority = priority
+        self.order = order
+
+def _kind(kind):
+    return type(None) if kind is None else kind
+
+def register(held_kind, target_kind, station=False, priority=0):
+    """
+    Decorator adding an interaction rule. held_kind / target_kind are classes
+    (None means empty hands / nothing selected). Rules with a higher priority are
+    tried first; equal priorities keep registration order.
+    """
+    def decorator(handler):
+        RULES.append(Rule(_kind(held_kind), _kind(target_kind), handler, station, priority, len(RULES)))
+        _compiled.clear()
+        return handler
+    return decorator
+
+def rules_for(held_type, station_type, target_type):
+    key = (held_type, station_type, target_type)
+    rules = _compiled.get(key)
+    if rules is None:
+        matching = []
+        for rule in RULES:
+            if not issubclass(held_type, rule.held_kind): continue
+            checked = station_type if rule.station else target_type
+            if issubclass(checked, rule.target_kind): matching.append(rule)
+        matching.sort(key=lambda rule: (-rule.priority, rule.order))
+        rules = tuple((rule.handler, rule.station) for rule in matching)
+        _compiled[key] = rules
+    return rules
+
+def dispatch(game, held_item, selected):
+    """Runs the rules for this press. Returns True if one of them handled it."""
+    target = selected
+    if isinstance(selected, Counter) and selected.held_item: target = selected.held_item
+
+    for handler, station in rules_for(type(held_item), type(selected), type(target)):
+        if handler(game, held_item, selected if station else target):
+            return True
+    return False
+
+# --- DEFAULT RULES ---
+
+@register(None, Crate, station=True)
+def take_from_crate(game, held_item, crate):
+    new_item = Ingredient(crate.ingredient_name, 0, 0)
+    game.items.add(new_item); game.all_sprites.add(new_item); game.player.pickup(new_item)
+    return True
+
+@register(Ingredient, Container)
+def fill_container(game, ingredient, container):
+    if container.add_ingredient(ingredient):
+        ingredient.kill(); game.player.inventory = None
+        return True
+    return False
+
+@register(Plate, Container)
+def plate_from_container(game, plate, container):
+    if container.food_ready:
+        plate.add_food(container.contents)
+        container.contents = []; container.food_ready = False; container.cooking_progress = 0
+        if isinstance(container, CookingContainer): container.redraw()
+        return True
+    return False
+
+@register(Container, Plate)
+def pour_onto_plate(game, container, plate):
+    if container.food_ready and len(plate.contents) == 0:
+        plate.add_food(container.contents)
+        container.contents = []; container.food_ready = False; container.cooking_progress = 0
+        if isinstance(container, CookingContainer): container.redraw()
+        return True
+    return False
+
+@register(Plate, ServingCounter, station=True)
+def deliver(game, plate, counter):
+    if len(plate.contents) > 0:
+        game.order_manager.check_delivery(plate.contents)
+        plate.kill(); game.player.inventory = None; counter.serve_plate(game.timers, game.rng)
+        return True
+    return False
+
+@register(Plate, Plate)
+def stack_plates(game, plate, other):
+    if plate.is_dirty == other.is_dirty and len(plate.contents) == 0 and len(other.contents) == 0:
+        other.stack_count += plate.stack_count
+        other.redraw()
+        plate.kill(); game.player.inventory = None
+        return True
+    return False
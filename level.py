@@ -11,7 +11,36 @@ class Level:
         self.floor_image.fill((220, 220, 220)) # Light Grey
         pygame.draw.rect(self.floor_image, (200, 200, 200), (0, 0, tile_size, tile_size), 1) # Border
 
+        # Pre-rendered static layers, see build_background()
+        self.floor_layer = None # Floor + grid only
+        self.background = None # Floor + grid + furniture
+        self.dirty_areas = [] # Background regions repainted since the last take_dirty_areas()
+
+    def build_background(self, static_sprites=()):
+        """Renders the floor, grid and furniture (which never moves) once."""
+        self.floor_layer = pygame.Surface((self.width, self.height))
+        self.draw_floor(self.floor_layer)
+        self.background = self.floor_layer.copy()
+        for sprite in static_sprites:
+            self.background.blit(sprite.image, sprite.rect)
+
+    def refresh(self, sprite):
+        """Repaints one piece of furniture on the background after its image changed (e.g. highlight)."""
+        if self.background is None: return
+        self.background.blit(self.floor_layer, sprite.rect, sprite.rect)
+        self.background.blit(sprite.image, sprite.rect)
+        self.dirty_areas.append(sprite.rect.copy())
+
+    def take_dirty_areas(self):
+        areas, self.dirty_areas = self.dirty_areas, []
+        return areas
+
     def draw(self, surface):
+        if self.background is None: self.build_background()
+        surface.blit(self.background, (0, 0))
+        self.dirty_areas = []
+
+    def draw_floor(self, surface):
         # Fill background first to prevent trails
         surface.fill((0, 0, 0)) 
         
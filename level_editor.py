@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import ttk, colorchooser, messagebox
 import json
 import os
+import datacache
 
 # --- CONFIGURATION ---
 DATA_FILE = 'gamedata.json'
@@ -47,14 +48,9 @@ class DarkLevelEditor:
         
         # 3. Load Level Data (if exists)
         if self.current_level_path:
-            self.level_data = self.load_json(self.current_level_path, {"objects": [], "recipes": {}})
+            self.level_data = self.load_level(self.current_level_path)
         else:
-            self.level_data = {"objects": [], "recipes": {}}
-
-        # Fix legacy format
-        if isinstance(self.level_data.get("recipes"), list):
-            new_recs = {r: [1800, 3600] for r in self.level_data["recipes"]}
-            self.level_data["recipes"] = new_recs
+            self.level_data = datacache.normalise_level({})
 
         # --- UI LAYOUT ---
         self.notebook = ttk.Notebook(self.root)
@@ -88,6 +84,11 @@ class DarkLevelEditor:
             with open(path, 'r') as f: return json.load(f)
         except: return default
 
+    def load_level(self, path):
+        # Same migration (old formats, missing config) as the game uses
+        try: return datacache.load_level(path)
+        except (OSError, ValueError): return datacache.normalise_level({})
+
     def save_json(self, path, data):
         with open(path, 'w') as f: json.dump(data, f, indent=4)
         print(f"Saved {path}")
@@ -521,6 +522,14 @@ class DarkLevelEditor:
         self.mode_dd.pack(side="left", padx=5)
         self.mode_dd.bind("<<ComboboxSelected>>", self.update_game_config_visibility)
 
+        # Order book size (applies to every mode, 0 = no cap)
+        mo_frame = ttk.Frame(gc_frame)
+        mo_frame.pack(fill="x", pady=5, padx=5)
+        ttk.Label(mo_frame, text="Max Orders:", width=12).pack(side="left")
+        self.var_max_orders = tk.IntVar(value=5)
+        ttk.Entry(mo_frame, textvariable=self.var_max_orders, width=10).pack(side="left", padx=5)
+        ttk.Label(mo_frame, text="(0 = unlimited)", font=("Arial", 8)).pack(side="left")
+
         # Dynamic Options Frame
         self.gc_opts_frame = ttk.Frame(gc_frame)
         self.gc_opts_frame.pack(fill="x", pady=5, padx=5)
@@ -591,12 +600,7 @@ class DarkLevelEditor:
         
         self.current_level_path = path
         # Load the selected level data
-        self.level_data = self.load_json(path, {"objects": [], "recipes": {}})
-        
-        # Convert legacy if needed
-        if isinstance(self.level_data.get("recipes"), list):
-            new_recs = {r: [1800, 3600] for r in self.level_data["recipes"]}
-            self.level_data["recipes"] = new_recs
+        self.level_data = self.load_level(path) # Legacy formats already migrated
             
         # Load Game Config
         config = self.level_data.get("config", {})
@@ -608,6 +612,7 @@ class DarkLevelEditor:
             self.var_score_2.set(star_scores[1])
             self.var_score_3.set(star_scores[2])
         self.var_order_goal.set(config.get("order_goal", 20))
+        self.var_max_orders.set(config.get("max_orders", 5))
         
         self.update_game_config_visibility()
             
@@ -813,7 +818,8 @@ class DarkLevelEditor:
             "mode": self.var_game_mode.get(),
             "time_limit": self.var_time_limit.get(),
             "star_thresholds": [self.var_score_1.get(), self.var_score_2.get(), self.var_score_3.get()],
-            "order_goal": self.var_order_goal.get()
+            "order_goal": self.var_order_goal.get(),
+            "max_orders": self.var_max_orders.get()
         }
         self.level_data["config"] = game_config
 
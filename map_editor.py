@@ -1,14 +1,17 @@
 import pygame
 import json
 import os
+import gamedata
+import datacache
 import tkinter as tk
 from tkinter import filedialog
+from fonts import get_font, render_text
 
 # --- Configuration ---
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 GRID_SIZE = 40
-DATA_FILE = "gamedata.json"
+DATA_FILE = gamedata.DATA_FILE
 
 # Colors
 WHITE = (255, 255, 255)
@@ -30,29 +33,21 @@ OBJECT_TYPES = [
     {"name": "Spawn", "color": (0, 255, 0), "type_id": "spawn_point", "layer": 1}, 
 ]
 
+# Lists come from the shared gamedata registry (one parse, re-read only if the file changed)
 def load_ingredient_list():
-    if not os.path.exists(DATA_FILE): return ["onion", "tomato"]
-    try:
-        with open(DATA_FILE, 'r') as f:
-            data = json.load(f)
-            return list(data.get("ingredients", {}).keys())
-    except: return ["onion", "tomato"]
+    data = gamedata.refresh()
+    if not data.loaded: return ["onion", "tomato"]
+    return list(data.ingredients.keys())
 
 def load_container_list():
-    if not os.path.exists(DATA_FILE): return ["pot", "pan"]
-    try:
-        with open(DATA_FILE, 'r') as f:
-            data = json.load(f)
-            return list(data.get("containers", {}).keys())
-    except: return ["pot", "pan"]
+    data = gamedata.refresh()
+    if not data.loaded: return ["pot", "pan"]
+    return list(data.containers.keys())
 
 def load_processor_list():
-    if not os.path.exists(DATA_FILE): return ["stove"]
-    try:
-        with open(DATA_FILE, 'r') as f:
-            data = json.load(f)
-            return list(data.get("processors", {}).keys())
-    except: return ["stove"]
+    data = gamedata.refresh()
+    if not data.loaded: return ["stove"]
+    return list(data.processors.keys())
 
 class MapEditor:
     def __init__(self):
@@ -60,8 +55,8 @@ class MapEditor:
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Level Editor - [S]ave As | [L]oad")
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont("Arial", 16)
-        self.large_font = pygame.font.SysFont("Arial", 24)
+        self.font = get_font("Arial", 16)
+        self.large_font = get_font("Arial", 24)
         
         self.current_idx = 0
         self.furniture_layer = {} 
@@ -98,8 +93,7 @@ class MapEditor:
         existing_data = {}
         if os.path.exists(file_path):
             try:
-                with open(file_path, 'r') as f:
-                    existing_data = json.load(f)
+                existing_data = datacache.load_level(file_path) # Legacy lists come back as dicts
             except: pass
         
         # 2. Build Objects List
@@ -113,11 +107,7 @@ class MapEditor:
             export_list.append(item)
             
         # 3. Update structure
-        if isinstance(existing_data, list): 
-            # Convert legacy list to dict
-            existing_data = {"objects": export_list}
-        else: 
-            existing_data["objects"] = export_list
+        existing_data["objects"] = export_list
             
         # 4. Save
         with open(file_path, 'w') as f:
@@ -141,11 +131,7 @@ class MapEditor:
         if not file_path: return
 
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            
-            # Handle formats
-            obj_list = data if isinstance(data, list) else data.get("objects", [])
+            obj_list = datacache.load_level(file_path)["objects"]
             
             self.furniture_layer = {}
             self.item_layer = {}
@@ -264,14 +250,14 @@ class MapEditor:
             pygame.draw.rect(self.screen, obj["color"], rect)
             pygame.draw.rect(self.screen, BLACK, rect, 1)
             if "args" in obj:
-                text = self.font.render(obj["args"][:3].upper(), True, BLACK)
+                text = render_text(self.font, obj["args"][:3].upper(), BLACK)
                 self.screen.blit(text, (loc[0]+5, loc[1]+10))
 
         for loc, obj in self.item_layer.items():
             rect = pygame.Rect(loc[0] + 5, loc[1] + 5, GRID_SIZE - 10, GRID_SIZE - 10)
             if obj["type_id"] == "spawn_point":
                 pygame.draw.rect(self.screen, obj["color"], rect, 4)
-                text = self.font.render("P", True, obj["color"])
+                text = render_text(self.font, "P", obj["color"])
                 self.screen.blit(text, (rect.centerx - 5, rect.centery - 10))
             else:
                 pygame.draw.rect(self.screen, obj["color"], rect)
@@ -280,7 +266,7 @@ class MapEditor:
         current_obj = OBJECT_TYPES[self.current_idx]
         ui_text = f"Tool: {current_obj['name']} | [S]ave [L]oad | [ESC] Exit"
         pygame.draw.rect(self.screen, BLACK, (0, SCREEN_HEIGHT - 30, SCREEN_WIDTH, 30))
-        text_surf = self.font.render(ui_text, True, WHITE)
+        text_surf = render_text(self.font, ui_text, WHITE)
         self.screen.blit(text_surf, (10, SCREEN_HEIGHT - 25))
         
         if not self.show_popup:
@@ -295,13 +281,13 @@ class MapEditor:
     def draw_popup(self):
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)); overlay.set_alpha(128); overlay.fill((0,0,0)); self.screen.blit(overlay, (0,0))
         pygame.draw.rect(self.screen, POPUP_BG, self.popup_rect); pygame.draw.rect(self.screen, POPUP_BORDER, self.popup_rect, 3)
-        title = self.large_font.render("Select Option", True, WHITE); self.screen.blit(title, (self.popup_rect.x + 20, self.popup_rect.y + 20))
+        title = render_text(self.large_font, "Select Option", WHITE); self.screen.blit(title, (self.popup_rect.x + 20, self.popup_rect.y + 20))
         self.option_rects = []; start_y = self.popup_rect.y + 70
         for i, item in enumerate(self.current_popup_items):
             item_rect = pygame.Rect(self.popup_rect.x + 20, start_y + (i * 40), 360, 30); self.option_rects.append(item_rect)
             mx, my = pygame.mouse.get_pos(); color = BLUE if item_rect.collidepoint(mx, my) else (80, 80, 80)
             pygame.draw.rect(self.screen, color, item_rect); pygame.draw.rect(self.screen, WHITE, item_rect, 1)
-            text = self.font.render(item.capitalize(), True, WHITE); self.screen.blit(text, (item_rect.x + 10, item_rect.y + 5))
+            text = render_text(self.font, item.capitalize(), WHITE); self.screen.blit(text, (item_rect.x + 10, item_rect.y + 5))
 
 if __name__ == "__main__":
     editor = MapEditor()
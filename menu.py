@@ -2,6 +2,7 @@ import pygame
 import os
 import sys
 import controls
+from fonts import get_font, render_text
 
 # Constants
 BG_COLOR = (30, 30, 30)
@@ -13,8 +14,8 @@ class Menu:
     def __init__(self, screen):
         self.screen = screen
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont("Arial", 40, bold=True)
-        self.small_font = pygame.font.SysFont("Arial", 28)
+        self.font = get_font("Arial", 40, bold=True)
+        self.small_font = get_font("Arial", 28)
         self.width = screen.get_width()
         self.height = screen.get_height()
         
@@ -61,7 +62,7 @@ class Menu:
                 overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
                 overlay.fill((0, 0, 0, 180))
                 self.screen.blit(overlay, (0,0))
-                msg = self.font.render(f"Press new key for {self.rebinding_action}...", True, (255, 255, 255))
+                msg = render_text(self.font, f"Press new key for {self.rebinding_action}...", (255, 255, 255))
                 rect = msg.get_rect(center=(self.width//2, self.height//2))
                 self.screen.blit(msg, rect)
 
@@ -160,14 +161,14 @@ class Menu:
             self.selected_index = 2
 
     def draw_menu(self, title, items):
-        title_surf = self.font.render(title, True, TEXT_COLOR)
+        title_surf = render_text(self.font, title, TEXT_COLOR)
         title_rect = title_surf.get_rect(center=(self.width // 2, 80))
         self.screen.blit(title_surf, title_rect)
         
         start_y = 200
         for i, item in enumerate(items):
             color = HIGHLIGHT_COLOR if i == self.selected_index else (100, 100, 100)
-            text = self.small_font.render(item, True, color)
+            text = render_text(self.small_font, item, color)
             rect = text.get_rect(center=(self.width // 2, start_y + (i * 60)))
             self.screen.blit(text, rect)
             
@@ -175,7 +176,7 @@ class Menu:
                 pygame.draw.rect(self.screen, HIGHLIGHT_COLOR, rect.inflate(40, 20), 2, border_radius=10)
 
     def draw_settings(self):
-        title_surf = self.font.render("Settings - Controls", True, TEXT_COLOR)
+        title_surf = render_text(self.font, "Settings - Controls", TEXT_COLOR)
         title_rect = title_surf.get_rect(center=(self.width // 2, 80))
         self.screen.blit(title_surf, title_rect)
         
@@ -189,7 +190,7 @@ class Menu:
             key_name = pygame.key.name(keys[0]) if keys else "None"
             # If multiple keys, show first
             
-            action_text = self.small_font.render(f"{action}: {key_name}", True, color)
+            action_text = render_text(self.small_font, f"{action}: {key_name}", color)
             rect = action_text.get_rect(center=(self.width // 2, start_y + (i * 40)))
             self.screen.blit(action_text, rect)
             
@@ -199,7 +200,7 @@ class Menu:
         # Draw Back button
         back_idx = len(actions)
         color = HIGHLIGHT_COLOR if back_idx == self.selected_index else (100, 100, 100)
-        text = self.small_font.render("Back", True, color)
+        text = render_text(self.small_font, "Back", color)
         rect = text.get_rect(center=(self.width // 2, start_y + (back_idx * 40) + 20))
         self.screen.blit(text, rect)
         
@@ -1,20 +1,36 @@
 import pygame
-import json
-import os
 import random
-
-# --- Load Data from JSON ---
-GAME_DATA = {}
-if os.path.exists('gamedata.json'):
-    try:
-        with open('gamedata.json', 'r') as f:
-            GAME_DATA = json.load(f)
-    except:
-        print("Error loading JSON")
+import inspect
+import functools
+import gamedata
+import surfaces
+from array import array
+from symbols import SYMBOLS, contents
+from spatial import SpatialGroup, ItemGroup, collide_sprite
+from fonts import get_font
 
 # --- BASE CLASSES ---
 
-class PhysicsEntity(pygame.sprite.Sprite):
+class SharedLook:
+    """Mixin for sprites (items and counters) that hold their normal and highlighted looks
+    as shared surfaces from surfaces.py, so selecting is just swapping image between them"""
+    highlighted = False
+
+    def show(self, key, paint):
+        """Points both looks at shared surfaces from surfaces.py (never draw on them)."""
+        self.image_normal = surfaces.get(key, paint)
+        self.image_highlight = surfaces.highlighted(key, paint)
+        self.image = self.image_highlight if self.highlighted else self.image_normal
+
+    def highlight(self):
+        self.highlighted = True
+        self.image = self.image_highlight
+
+    def reset(self):
+        self.highlighted = False
+        self.image = self.image_normal
+
+class PhysicsEntity(SharedLook, pygame.sprite.Sprite):
     """Base class for anything that can be carried (Ingredients, Pots, Plates)"""
     def __init__(self, x, y):
         super().__init__()
@@ -29,6 +45,12 @@ class PhysicsEntity(pygame.sprite.Sprite):
         self.velocity = pygame.math.Vector2(0, 0)
         self.rect.center = counter.rect.center
         counter.held_item = self
+        self.moved()
+
+    def moved(self):
+        """Call after changing physics_state or the resting position, keeps grid-indexed groups in sync"""
+        for group in self.groups():
+            if isinstance(group, SpatialGroup): group.relocate(self)
 
     def update(self, walls):
         """Physics logic for flying items"""
@@ -37,78 +59,86 @@ class PhysicsEntity(pygame.sprite.Sprite):
             self.rect.y += self.velocity.y
             
             # Check for collisions with counters while flying
-            hits = pygame.sprite.spritecollide(self, walls, False)
+            hits = collide_sprite(self, walls)
             if hits:
                 target = hits[0]
                 if target.held_item is None:
                     self.snap_to_counter(target)
 
     # --- VISUAL METHODS ---
-    def highlight(self):
-        pygame.draw.rect(self.image, (255, 255, 100), (0, 0, self.rect.width, self.rect.height), 2)
-
-    def reset(self):
-        self.redraw()
-
     def redraw(self):
         pass
 
+def paint_ingredient(key):
+    _, color, state, highlight = key
+    if highlight: return surfaces.with_border(key, paint_ingredient)
+    image = pygame.Surface((20, 20))
+    image.fill(color)
+    if state == "chopped":
+        pygame.draw.line(image, (255, 255, 255), (10, 0), (10, 20), 2)
+    return image
+
 class Ingredient(PhysicsEntity):
     def __init__(self, name, x, y):
         self.name = name
-        
-        data = GAME_DATA.get("ingredients", {}).get(name, {})
-        self.colors = {
-            "raw": tuple(data.get("color_raw", (255, 165, 0))),
-            "chopped": tuple(data.get("color_chopped", (200, 200, 200))),
-            "cooked": tuple(data.get("color_cooked", (150, 100, 50))),
-            "burnt": tuple(data.get("color_burnt", (0, 0, 0)))
-        }
-        self.prepare_time = data.get("prepare_time", 100)
-        self.cook_time = data.get("cook_time", 100)
-        self.burn_time = data.get("burn_time", 100)
+        self.apply_data(gamedata.get().ingredient(name))
 
         self.state = "raw"
         self.progress = 0
+        self.version = 0 # Bumped on every state change, the only time the image changes
         
-        self.image = pygame.Surface((20, 20))
-        
-        # Init physics
+        self.redraw() # Sets image, which PhysicsEntity needs for the rect
         super().__init__(x, y)
-        self.redraw() # Draw AFTER init
+
+    def apply_data(self, data):
+        """Takes colours and times from a gamedata.IngredientDef (also used by hot reload)."""
+        self.colors = {
+            "raw": data.color_raw,
+            "chopped": data.color_chopped,
+            "cooked": data.color_cooked,
+            "burnt": data.color_burnt
+        }
+        self.prepare_time = data.prepare_time
+        self.cook_time = data.cook_time
+        self.burn_time = data.burn_time
 
     def redraw(self):
         color = self.colors.get(self.state, (255, 255, 255))
-        self.image.fill(color)
-        
-        if self.state == "chopped":
-            pygame.draw.line(self.image, (255, 255, 255), (10, 0), (10, 20), 2)
+        self.show(("ingredient", color, self.state, False), paint_ingredient)
+
+    def set_state(self, state):
+        self.state = state
+        self.version += 1
+        self.redraw()
+
+    @property
+    def progress_pct(self):
+        """Fraction shown by a station's progress bar."""
+        target = self.prepare_time if self.prepare_time else 100
+        return min(1.0, self.progress / target)
 
     def chop_tick(self, amount=1):
         if self.state == "raw":
             self.progress += amount
             if self.progress >= self.prepare_time:
-                self.state = "chopped"
                 self.progress = 0
-                self.redraw()
+                self.set_state("chopped")
 
     def cook_tick(self, amount=1):
         if self.state == "chopped":
             self.progress += amount
             if self.progress >= self.cook_time:
-                self.state = "cooked"
                 self.progress = 0 
-                self.redraw()
+                self.set_state("cooked")
         elif self.state == "cooked":
             self.progress += amount
             if self.progress >= self.burn_time:
-                self.state = "burnt"
-                self.redraw()
+                self.set_state("burnt")
 
     def update(self, walls):
         super().update(walls)
         if self.physics_state == "FLYING":
-            hits = pygame.sprite.spritecollide(self, walls, False)
+            hits = collide_sprite(self, walls)
             if hits:
                 target_counter = hits[0]
                 if target_counter.held_item and hasattr(target_counter.held_item, "add_ingredient"):
@@ -122,7 +152,7 @@ class Ingredient(PhysicsEntity):
 class Container(PhysicsEntity):
     def __init__(self, name, x, y):
         self.name = name
-        self.contents = [] 
+        self.contents = contents() # Symbol codes, see symbols.py
         super().__init__(x, y)
         
         # Variables used by redraw()
@@ -136,21 +166,47 @@ class Container(PhysicsEntity):
 
 from cooking import CookingManager
 
+def paint_container(key):
+    _, visual_type, state, highlight = key
+    if highlight: return surfaces.with_border(key, paint_container)
+    image = pygame.Surface((30, 30))
+    # Generic background
+    if visual_type == "pot":
+        image.fill((50, 50, 50)) 
+        pygame.draw.rect(image, (30,30,30), (0, 10, 30, 10))
+        if state == "ready":
+            image.fill((160, 82, 45)) # Soup Color
+    elif visual_type == "pan":
+        image.fill((20, 20, 20)) 
+        pygame.draw.line(image, (60, 60, 60), (15, 30), (15, 0), 4)
+        if state == "ready":
+            pygame.draw.circle(image, (139, 69, 19), (15, 15), 10)
+    else:
+        image.fill((100, 100, 100)) # Default/Wok?
+        
+    if state == "burnt":
+         image.fill((0, 0, 0))
+    return image
+
 class CookingContainer(Container):
     def __init__(self, name, x, y):
         # 1. Load Data (for visual type only, logic is in manager)
-        data = GAME_DATA.get("containers", {}).get(name, {})
-        self.visual_type = data.get("visual_type", name)
-        
-        self.image = pygame.Surface((30, 30))
+        data = gamedata.get()
+        self.visual_type = data.container(name).visual_type
         
         # 2. Init Manager
-        self.manager = CookingManager(name, GAME_DATA)
+        self.manager = CookingManager(name, data)
         
-        # 3. Init Parent
-        super().__init__(name, x, y)
+        # 3. Draw (PhysicsEntity needs the image for the rect)
+        self.redraw()
         
-        # 4. Draw
+        # 4. Init Parent
+        super().__init__(name, x, y)
+
+    def apply_data(self, data):
+        """Hot reload: picks up container / ingredient changes from a new gamedata.GameData."""
+        self.visual_type = data.container(self.name).visual_type
+        self.manager.apply_data(data)
         self.redraw()
 
     @property
@@ -162,7 +218,8 @@ class CookingContainer(Container):
         # Allow external sets if necessary, but manager tracks it. 
         # For compatibility with some hacks, we might need to sync.
         # But generally, we should avoid setting this directly.
-        self.manager.contents = value
+        self.manager.contents = array('H', value)
+        self.manager.changed()
 
     # Compatibility properties for Stove and other systems
     @property
@@ -175,6 +232,7 @@ class CookingContainer(Container):
         # For init, if False, do nothing.
         if not value and self.manager.state == "COOKING":
              self.manager.state = "IDLE"
+        self.manager.changed()
 
     @property
     def food_ready(self):
@@ -188,6 +246,7 @@ class CookingContainer(Container):
              # But init sets False.
              if self.manager.state != "COOKED": pass # Ignore init
              else: self.manager.state = "IDLE"
+        self.manager.changed()
 
     @property
     def is_burnt(self):
@@ -199,7 +258,8 @@ class CookingContainer(Container):
         elif self.manager.state == "BURNT":
             # Resetting burnt?
             self.manager.state = "IDLE"
-            self.manager.contents = [] # Clear sludge?
+            self.manager.contents = contents() # Clear sludge?
+        self.manager.changed()
     
     @property
     def cooking_progress(self):
@@ -208,6 +268,7 @@ class CookingContainer(Container):
     @cooking_progress.setter
     def cooking_progress(self, value):
         self.manager.current_progress = value
+        self.manager.changed()
 
     @property
     def cook_time_req(self):
@@ -217,6 +278,7 @@ class CookingContainer(Container):
     @cook_time_req.setter
     def cook_time_req(self, value):
         self.manager.target_progress = value
+        self.manager.changed()
 
     @property
     def burn_progress(self):
@@ -225,6 +287,7 @@ class CookingContainer(Container):
     @burn_progress.setter
     def burn_progress(self, value):
         self.manager.burn_progress = value
+        self.manager.changed()
 
     @property
     def burn_limit(self):
@@ -233,28 +296,14 @@ class CookingContainer(Container):
     @burn_limit.setter
     def burn_limit(self, value):
         self.manager.burn_limit = value
+        self.manager.changed()
 
     def redraw(self):
-        # Generic background
-        if self.visual_type == "pot":
-            self.image.fill((50, 50, 50)) 
-            pygame.draw.rect(self.image, (30,30,30), (0, 10, 30, 10))
-            # ONLY show soup if full
-            is_full = len(self.manager.contents) >= self.manager.min_items
-            if self.food_ready and is_full:
-                self.image.fill((160, 82, 45)) # Soup Color
-        elif self.visual_type == "pan":
-            self.image.fill((20, 20, 20)) 
-            pygame.draw.line(self.image, (60, 60, 60), (15, 30), (15, 0), 4)
-            # Pan usually 1 item, so min_items is 1.
-            is_full = len(self.manager.contents) >= self.manager.min_items
-            if self.food_ready and is_full:
-                pygame.draw.circle(self.image, (139, 69, 19), (15, 15), 10)
-        else:
-            self.image.fill((100, 100, 100)) # Default/Wok?
-            
-        if self.is_burnt:
-             self.image.fill((0, 0, 0))
+        self.drawn_version = self.manager.version
+        if self.is_burnt: state = "burnt"
+        elif self.food_ready and len(self.manager.contents) >= self.manager.min_items: state = "ready" # ONLY show food if full
+        else: state = "empty"
+        self.show(("container", self.visual_type, state, False), paint_container)
 
     def add_ingredient(self, ingredient):
         # Delegate to manager
@@ -270,42 +319,50 @@ class CookingContainer(Container):
 
     def cook_tick(self, amount=1.0):
         self.manager.tick(amount)
-        if self.manager.state in ["COOKED", "BURNT", "COOKING"]:
-             self.redraw()
+        if self.manager.version != self.drawn_version:
+             self.redraw() # Only on a state / contents change, not every tick
+
 
+def paint_plate(key):
+    _, stack_count, state, highlight = key
+    if highlight: return surfaces.with_border(key, paint_plate)
+    image = pygame.Surface((30, 30))
+    image.fill((255, 255, 255)) 
+    pygame.draw.circle(image, (200, 200, 200), (15, 15), 12, 1)
+    
+    if state == "dirty":
+        pygame.draw.circle(image, (100, 150, 100), (15, 15), 10)
+    elif state == "food":
+        pygame.draw.circle(image, (160, 82, 45), (15, 15), 8)
+
+    if stack_count > 1:
+        pygame.draw.circle(image, (255, 0, 0), (22, 8), 8)
+        text = get_font("Arial", 20, bold=True).render(str(stack_count), True, (255, 255, 255))
+        image.blit(text, (18, 0))
+    return image
 
 class Plate(Container):
     def __init__(self, x, y):
-        self.image = pygame.Surface((30, 30))
-        self.font = pygame.font.SysFont("Arial", 20, bold=True)
-        
-        # 1. Initialize Parent FIRST
-        super().__init__("plate", x, y)
-        
-        # 2. Plate Stats
+        # 1. Plate Stats
         self.is_dirty = False
         self.stack_count = 1
+        self.contents = contents()
         
-        # 3. Draw
+        # 2. Draw (PhysicsEntity needs the image for the rect)
         self.redraw()
-
-    def redraw(self):
-        self.image.fill((255, 255, 255)) 
-        pygame.draw.circle(self.image, (200, 200, 200), (15, 15), 12, 1)
         
-        if self.is_dirty:
-            pygame.draw.circle(self.image, (100, 150, 100), (15, 15), 10)
-        elif len(self.contents) > 0:
-            pygame.draw.circle(self.image, (160, 82, 45), (15, 15), 8)
+        # 3. Initialize Parent
+        super().__init__("plate", x, y)
 
-        if self.stack_count > 1:
-            pygame.draw.circle(self.image, (255, 0, 0), (22, 8), 8)
-            text = self.font.render(str(self.stack_count), True, (255, 255, 255))
-            self.image.blit(text, (18, 0))
+    def redraw(self):
+        if self.is_dirty: state = "dirty"
+        elif len(self.contents) > 0: state = "food"
+        else: state = "clean"
+        self.show(("plate", self.stack_count, state, False), paint_plate)
 
     def add_food(self, content_data):
         if self.is_dirty or self.stack_count > 1: return
-        if isinstance(content_data, list): self.contents.extend(content_data)
+        if isinstance(content_data, (list, array)): self.contents.extend(content_data)
         else: self.contents.append(content_data)
         self.redraw()
 
@@ -318,204 +375,268 @@ class Plate(Container):
             return False
 
         # Allow adding if empty OR if we are building a recipe on a single plate
-        # We generally allow adding if it's not full? 
         # For this game, plates usually hold one completed meal or partials.
-        # Let's assume infinite capacity for simplicity or check order match later.
-        # But UI might look weird. For now, just append.
+        # Anything that would leave the plate matching no recipe at all is refused.
         
-        # Handle State Suffixes
-        name_to_add = ingredient.name
-        if ingredient.state == "chopped":
-            name_to_add += "_chopped"
-        elif ingredient.state == "cooked":
-             # Optional: name_to_add += "_cooked" 
-             # But legacy recipes just use "onion" for cooked onion soup usually?
-             # Let's check: onion_soup uses "onion". Stove cooks it. 
-             # Does stove change name in contents? 
-             # Stove -> CookingManager -> matches recipe -> produces output? 
-             # Actually, soup is liquid. 
-             # Burgers: Cooked patty on plate.
-             # If we put cooked item, we probably want just the name if that's what recipes use.
-             # Standardizing on existing behavior for cooked items.
-             pass
-        elif ingredient.state == "burnt":
+        # Handle States: chopped items become "<name>_chopped", cooked ones keep the plain
+        # name that recipes use (Burgers: cooked patty on plate). See symbols.content_name.
+        if ingredient.state == "burnt":
              return False # Don't plate burnt stuff usually? Or maybe allow it for failure.
 
-        self.contents.append(name_to_add)
+        # Which recipes a partly built plate can still become, see recipes.RecipeIndex
+        code = SYMBOLS.code(ingredient.name, ingredient.state)
+        recipe_index = self.recipe_index()
+        if recipe_index.recipe_count and not recipe_index.can_add(self.contents, code):
+            return False
+
+        self.contents.append(code)
         self.redraw()
         return True
 
+    def recipe_index(self):
+        """The level's recipes (from the Game's ItemGroup), or every recipe in gamedata outside a game."""
+        for group in self.groups():
+            if isinstance(group, ItemGroup) and group.recipe_index is not None: return group.recipe_index
+        return gamedata.get().recipe_index
+
     def make_dirty(self):
         self.is_dirty = True
-        self.contents = []
+        self.contents = contents()
         self.redraw()
 
     def clean(self):
         self.is_dirty = False
-        self.contents = []
+        self.contents = contents()
         self.redraw()
 
 # --- STATION OBJECTS ---
 
-class Counter(pygame.sprite.Sprite):
+def paint_counter(key):
+    _, (width, height), _, highlight = key
+    image = pygame.Surface((width, height))
+    if highlight:
+        image.fill((180, 110, 60))
+        pygame.draw.rect(image, (255, 255, 100), (0, 0, width, height), 2)
+    else:
+        image.fill((139, 69, 19)) 
+        pygame.draw.rect(image, (100, 50, 10), (0, 0, width, height), 2)
+    return image
+
+class Counter(SharedLook, pygame.sprite.Sprite):
     def __init__(self, x, y, width=40, height=40):
         super().__init__()
+        self.active_group = None # Game's active station set, assigned when placed in a level
         self.held_item = None
-        self.image_normal = pygame.Surface((width, height))
-        self.image_normal.fill((139, 69, 19)) 
-        pygame.draw.rect(self.image_normal, (100, 50, 10), (0, 0, width, height), 2)
-        
-        self.image_highlight = pygame.Surface((width, height))
-        self.image_highlight.fill((180, 110, 60))
-        pygame.draw.rect(self.image_highlight, (255, 255, 100), (0, 0, width, height), 2)
-
-        self.image = self.image_normal
+        self.show(("counter", (width, height), None, False), paint_counter)
         self.rect = self.image.get_rect()
         self.rect.topleft = (x, y)
 
-    def highlight(self):
-        self.image = self.image_highlight
-    def reset(self):
-        self.image = self.image_normal
     def update(self):
         pass 
 
+    @property
+    def held_item(self):
+        return self._held_item
+
+    @held_item.setter
+    def held_item(self, item):
+        self._held_item = item
+        self.item_placed(item)
+        self.refresh_activity()
+
+    def item_placed(self, item):
+        """Called whenever held_item changes (item is None when it was taken off)."""
+        pass
+
+    def has_work(self):
+        """True while the station needs update() / draw_progress_bar() every frame"""
+        return False
+
+    def refresh_activity(self):
+        """Joins or leaves the active station set. Call whenever has_work() may have changed."""
+        if self.active_group is None: return
+        if self.has_work(): self.active_group.add(self)
+        else: self.active_group.remove(self)
+
 # Removed legacy CuttingBoard class as it is now a Processor alias
 
 
+def paint_processor(key):
+    _, color, _, highlight = key
+    if highlight: return surfaces.with_border(key, paint_processor)
+    image = pygame.Surface((40, 40))
+    image.fill(color) 
+    # Add a generic visual detail (circle)
+    pygame.draw.circle(image, (20, 20, 20), (20, 20), 12)
+    pygame.draw.rect(image, (30, 30, 30), (0, 0, 40, 40), 2)
+    return image
+
 class Processor(Counter):
     def __init__(self, x, y, type_id="stove"):
         super().__init__(x, y)
         self.type_id = type_id
-        self.data = GAME_DATA.get("processors", {}).get(type_id, {})
-        
-        # 1. Visuals
-        color = tuple(self.data.get("color", (50, 50, 50)))
-        
-        # Override image_normal from Counter
-        self.image_normal = pygame.Surface((40, 40))
-        self.image_normal.fill(color) 
-        # Add a generic visual detail (circle)
-        pygame.draw.circle(self.image_normal, (20, 20, 20), (20, 20), 12)
-        pygame.draw.rect(self.image_normal, (30, 30, 30), (0, 0, 40, 40), 2)
-
-        self.image_highlight = self.image_normal.copy()
-        pygame.draw.rect(self.image_highlight, (255, 255, 100), (0, 0, 40, 40), 2)
+        self.apply_data(gamedata.get().processor(type_id))
+
+    def apply_data(self, data):
+        """Takes looks and processing params from a gamedata.ProcessorDef (also used by hot reload)."""
+        self.data = data
         
-        self.image = self.image_normal
+        # 1. Visuals (override the Counter look)
+        self.show(("processor", self.data.color, None, False), paint_processor)
         
         # 2. Logic Params
-        self.process_method = self.data.get("process_method", "cook_tick")
-        self.progress_bar_color = tuple(self.data.get("progress_bar_color", (0, 255, 0)))
-        self.processing_speed = self.data.get("processing_speed", 1.0)
-        self.requires_interaction = self.data.get("requires_interaction", False)
+        self.process_method = self.data.process_method
+        self.progress_bar_color = self.data.progress_bar_color
+        self.processing_speed = self.data.processing_speed
+        self.requires_interaction = self.data.requires_interaction
+
+        # Params may have changed under an item that is already on the station
+        self.bind(self.held_item)
+
+    def item_placed(self, item):
+        self.bind(item)
+
+    def accepts(self, item):
+        """accepted_items in gamedata lists item or container names, an empty list accepts anything."""
+        accepted = self.data.accepted_items
+        if not accepted: return True
+        # Mod items don't have to carry a name
+        return getattr(item, "name", None) in accepted or (isinstance(item, CookingContainer) and item.visual_type in accepted)
+
+    def bind(self, item):
+        """
+        Resolves the processing call for the item on the station once, when it is
+        placed, so the per tick path is a plain call. Items that aren't accepted or
+        have no process_method just sit on the station. So do items whose method
+        takes neither amount= nor no arguments (a mod mismatch), with an error
+        printed, so the station stays usable.
+        Never raises: it runs inside the held_item setter and hot reload.
+        """
+        self.process = None
+        if item is None or not self.accepts(item): return
+        method = getattr(item, self.process_method, None)
+        if method is None: return
+
+        try:
+            signature = inspect.signature(method)
+        except (TypeError, ValueError): # Some builtins / C callables can't be introspected
+            print(f"ERROR: processor '{self.type_id}' can't inspect {type(item).__name__}.{self.process_method}, "
+                  f"the item will not be processed.")
+            return
+        try:
+            signature.bind(amount=self.processing_speed)
+            self.process = functools.partial(method, amount=self.processing_speed)
+        except TypeError:
+            try:
+                signature.bind()
+            except TypeError:
+                print(f"ERROR: processor '{self.type_id}' can't use {type(item).__name__}.{self.process_method}{signature}, "
+                      f"it must accept amount= or no arguments. The item will not be processed.")
+                return
+            self.process = method
+
+    def has_work(self):
+        return self.held_item is not None
 
     def update(self):
         # Automatic processing only if interaction NOT required
-        if not self.requires_interaction:
-            if self.held_item and hasattr(self.held_item, self.process_method):
-                try:
-                    getattr(self.held_item, self.process_method)(amount=self.processing_speed)
-                except TypeError:
-                    getattr(self.held_item, self.process_method)()
+        if self.process and not self.requires_interaction:
+            self.process()
 
     def interact_hold(self):
         # Manual processing only if interaction IS required
-        if self.requires_interaction:
-             if self.held_item and hasattr(self.held_item, self.process_method):
-                try:
-                    getattr(self.held_item, self.process_method)(amount=self.processing_speed)
-                except TypeError:
-                    getattr(self.held_item, self.process_method)()
+        if self.process and self.requires_interaction:
+            self.process()
 
     def draw_progress_bar(self, screen):
+        """Draws the progress bar above the station, returns the area drawn (or None)"""
         if not self.held_item: return
         
         item = self.held_item
-        current = 0
-        target = 100
-        is_active = False
-        is_ready = False
-        is_burnt = False
-        
-        # Try to detect progress (Generic or Specific)
-        if hasattr(item, "is_cooking"): # specialized for CookingContainer
-             is_active = item.is_cooking
-             if hasattr(item, "cooking_progress"): current = item.cooking_progress
-             if hasattr(item, "cook_time_req"): target = item.cook_time_req
-             if hasattr(item, "food_ready"): is_ready = item.food_ready
-             if hasattr(item, "is_burnt"): is_burnt = item.is_burnt
-        elif hasattr(item, "progress") and hasattr(item, "prepare_time"): # Ingredient/Generic
-             current = item.progress
-             target = item.prepare_time
-             if current > 0: is_active = True # Assume active if progress > 0
-        
-        # Draw Bar
-        if is_active or (current > 0 and not is_ready):
-            if target == 0: target = 100
-            pct = current / target
-            if pct > 1: pct = 1
-            
-            # Double bar style (from original Stove) ??
-            # Original Stove drew current/target.
-            pygame.draw.rect(screen, (0,0,0), (self.rect.x + 5, self.rect.y - 10, 30, 5))
-            pygame.draw.rect(screen, self.progress_bar_color, (self.rect.x + 5, self.rect.y - 10, 30 * pct, 5))
-            
-        elif is_ready and not is_burnt:
-             # Burning Phase (specific to CookingContainer mostly)
-             if hasattr(item, "burn_progress") and hasattr(item, "burn_limit"):
-                 pct = item.burn_progress / item.burn_limit
-                 if pct > 1: pct = 1
-                 color = (255, 0, 0)
-                 if (pygame.time.get_ticks() // 200) % 2 == 0: color = (255, 100, 100)
-                 pygame.draw.rect(screen, (0,0,0), (self.rect.x + 5, self.rect.y - 10, 30, 5))
-                 pygame.draw.rect(screen, color, (self.rect.x + 5, self.rect.y - 10, 30 * pct, 5))
+        if isinstance(item, CookingContainer):
+            manager = item.manager
+            # Cooking bar, also left full on a burnt pot
+            if manager.state == "COOKING" or (manager.current_progress > 0 and manager.state != "COOKED"):
+                return self.draw_bar(screen, manager.progress_pct, self.progress_bar_color)
+            elif manager.state == "COOKED":
+                # Burning Phase
+                color = (255, 0, 0)
+                if (pygame.time.get_ticks() // 200) % 2 == 0: color = (255, 100, 100)
+                return self.draw_bar(screen, manager.burn_pct, color)
+        else:
+            # Ingredients and mod items: anything exposing progress_pct, active while above 0
+            pct = getattr(item, "progress_pct", None)
+            if pct: return self.draw_bar(screen, pct, self.progress_bar_color)
+
+    def draw_bar(self, screen, pct, color):
+        pygame.draw.rect(screen, (0,0,0), (self.rect.x + 5, self.rect.y - 10, 30, 5))
+        pygame.draw.rect(screen, color, (self.rect.x + 5, self.rect.y - 10, 30 * pct, 5))
+        return pygame.Rect(self.rect.x + 5, self.rect.y - 10, 30, 5)
 
 class Stove(Processor):
     def __init__(self, x, y):
         super().__init__(x, y, "stove")
 
+def paint_serving_counter(key):
+    if key[3]: return surfaces.with_border(key, paint_serving_counter)
+    image = pygame.Surface((40, 40))
+    image.fill((50, 50, 50)) 
+    pygame.draw.rect(image, (200, 200, 200), (0, 0, 20, 20))
+    pygame.draw.rect(image, (200, 200, 200), (20, 20, 20, 20))
+    return image
+
 class ServingCounter(Counter):
     def __init__(self, x, y):
         super().__init__(x, y)
-        self.image_normal.fill((50, 50, 50)) 
-        pygame.draw.rect(self.image_normal, (200, 200, 200), (0, 0, 20, 20))
-        pygame.draw.rect(self.image_normal, (200, 200, 200), (20, 20, 20, 20))
-        self.image_highlight = self.image_normal.copy()
-        pygame.draw.rect(self.image_highlight, (255, 255, 100), (0, 0, 40, 40), 2)
-        self.image = self.image_normal
-        self.pending_returns = []
-
-    def serve_plate(self):
-        return_time = random.randint(300, 600) 
-        self.pending_returns.append(return_time)
+        self.show(("serving_counter", None, None, False), paint_serving_counter)
+        self.pending_returns = {} # Return timers for plates out in the dining room
+        self.next_return_id = 0
+        self.plates_due = 0 # Returned plates waiting for the counter to be clear
+
+    def serve_plate(self, timers, rng=random):
+        return_time = rng.randint(300, 600) 
+        self.next_return_id += 1
+        self.pending_returns[self.next_return_id] = timers.schedule(return_time, self.plate_returned, self.next_return_id)
         print(f"DEBUG: Plate served! Returns in {return_time} frames.")
 
+    def plate_returned(self, return_id):
+        """Timer callback: a dirty plate is back and will appear once the counter is clear"""
+        del self.pending_returns[return_id]
+        self.plates_due += 1
+        self.refresh_activity()
+
+    def has_work(self):
+        return self.plates_due > 0
+
     def update(self, items_group=None, all_sprites=None):
         if items_group is None: return
-        for i in range(len(self.pending_returns) - 1, -1, -1):
-            self.pending_returns[i] -= 1
-            if self.pending_returns[i] <= 0:
-                if self.held_item is None:
-                    self.pending_returns.pop(i)
-                    plate = Plate(0, 0)
-                    plate.make_dirty()
-                    plate.snap_to_counter(self)
-                    items_group.add(plate)
-                    all_sprites.add(plate)
-                    print("DEBUG: Dirty plate returned!")
+        if self.plates_due > 0 and self.held_item is None:
+            self.plates_due -= 1
+            plate = Plate(0, 0)
+            plate.make_dirty()
+            plate.snap_to_counter(self)
+            items_group.add(plate)
+            all_sprites.add(plate)
+            print("DEBUG: Dirty plate returned!")
+        self.refresh_activity()
+
+def paint_sink(key):
+    if key[3]: return surfaces.with_border(key, paint_sink)
+    image = pygame.Surface((40, 40))
+    image.fill((100, 100, 100)) # Metal
+    pygame.draw.rect(image, (50, 150, 255), (5, 5, 30, 30)) # Water
+    return image
 
 class Sink(Counter):
     def __init__(self, x, y):
         super().__init__(x, y)
-        self.image_normal.fill((100, 100, 100)) # Metal
-        pygame.draw.rect(self.image_normal, (50, 150, 255), (5, 5, 30, 30)) # Water
-        self.image_highlight = self.image_normal.copy()
-        pygame.draw.rect(self.image_highlight, (255, 255, 100), (0, 0, 40, 40), 2)
-        self.image = self.image_normal
+        self.show(("sink", None, None, False), paint_sink)
         self.wash_progress = 0
         self.wash_time_req = 150 
 
+    def has_work(self):
+        return self.held_item is not None
+
     def interact_hold(self):
         if self.held_item:
             # 1. Wash Dirty Plates
@@ -525,19 +646,6 @@ class Sink(Counter):
                     self.wash_progress = 0
                     if self.held_item.stack_count > 1:
                         self.held_item.stack_count -= 1
-                        self.held_item.redraw_plate() # Assuming redraw_plate exists or redraw
-                        # Wait, Plate has redraw(), not redraw_plate(). 
-                        # Checking Plate class... it has redraw(). 
-                        # Let me double check if redraw_plate was used in original code.
-                        # Original code line 528: `plate.redraw_plate()`
-                        # But Plate definition around line 292 shows `redraw(self)`.
-                        # It seems the original code might have had a bug or I missed a method alias.
-                        # I will use self.held_item.redraw() to be safe or keep original if it works.
-                        # Actually, looking at original file content:
-                        # Line 528: plate.redraw_plate()
-                        # Line 277-357: Plate class. Methods: __init__, redraw, add_food, add_ingredient, make_dirty, clean.
-                        # There is NO redraw_plate(). The original code has a BUG. 
-                        # I will fix this bug while I am here.
                         self.held_item.redraw()
                         return "WASHED_STACK"
                     else:
@@ -569,22 +677,29 @@ class Sink(Counter):
             if pct > 1: pct = 1
             pygame.draw.rect(screen, (0,0,0), (self.rect.x + 5, self.rect.y - 10, 30, 5))
             pygame.draw.rect(screen, (0, 200, 255), (self.rect.x + 5, self.rect.y - 10, 30 * pct, 5))
+            return pygame.Rect(self.rect.x + 5, self.rect.y - 10, 30, 5)
+
+def paint_crate(key):
+    _, (base_color, icon_color), _, highlight = key
+    if highlight: return surfaces.with_border(key, paint_crate)
+    image = pygame.Surface((40, 40))
+    image.fill(base_color)
+    border_col = (50, 30, 10)
+    pygame.draw.rect(image, border_col, (0, 0, 40, 40), 4)
+    pygame.draw.line(image, border_col, (0, 10), (40, 10), 2)
+    pygame.draw.line(image, border_col, (0, 20), (40, 20), 2)
+    pygame.draw.line(image, border_col, (0, 30), (40, 30), 2)
+    pygame.draw.rect(image, icon_color, (15, 15, 10, 10))
+    return image
 
 class Crate(Counter):
     def __init__(self, x, y, ingredient_name):
         super().__init__(x, y)
         self.ingredient_name = ingredient_name
-        data = GAME_DATA.get("ingredients", {}).get(ingredient_name, {})
-        base_color = tuple(data.get("crate_color", (100, 100, 100))) 
-        self.image_normal = pygame.Surface((40, 40))
-        self.image_normal.fill(base_color)
-        border_col = (50, 30, 10)
-        pygame.draw.rect(self.image_normal, border_col, (0, 0, 40, 40), 4)
-        pygame.draw.line(self.image_normal, border_col, (0, 10), (40, 10), 2)
-        pygame.draw.line(self.image_normal, border_col, (0, 20), (40, 20), 2)
-        pygame.draw.line(self.image_normal, border_col, (0, 30), (40, 30), 2)
-        icon_color = tuple(data.get("color_raw", (255, 255, 255)))
-        pygame.draw.rect(self.image_normal, icon_color, (15, 15, 10, 10))
-        self.image_highlight = self.image_normal.copy()
-        pygame.draw.rect(self.image_highlight, (255, 255, 100), (0, 0, 40, 40), 2)
-        self.image = self.image_normal
+        self.apply_data(gamedata.get().ingredients.get(ingredient_name))
+
+    def apply_data(self, data):
+        """Paints the crate for a gamedata.IngredientDef (None if the ingredient is unknown)."""
+        base_color = data.crate_color if data else (100, 100, 100)
+        icon_color = data.color_raw if data else (255, 255, 255)
+        self.show(("crate", (base_color, icon_color), None, False), paint_crate)
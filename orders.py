@@ -1,124 +1,172 @@
 import pygame
 import random
-import json
-import os
+import heapq
+import itertools
+import gamedata
+import datacache
+from gamedata import recipe_signature
+from recipes import RecipeIndex
+from timers import TimerScheduler
 
-# Load Data
-def load_game_data():
-    if os.path.exists('gamedata.json'):
-        try:
-            with open('gamedata.json', 'r') as f:
-                return json.load(f)
-        except:
-            print("Error loading JSON in orders.py")
-    return {}
-
-GAME_DATA = load_game_data()
+DEFAULT_MAX_ORDERS = 5
 
 class Order:
-    def __init__(self, recipe_name, duration):
+    def __init__(self, recipe_name, duration, book=None):
         self.recipe_name = recipe_name
-        self.data = GAME_DATA.get("recipes", {}).get(recipe_name, {})
-        self.ingredients = self.data.get("ingredients", [])
+        self.data = gamedata.get().recipe(recipe_name)
+        self.contents = self.data.codes # Symbol codes, see symbols.py
+        self.signature = self.data.signature
         
+        # Nothing counts down per tick: the deadline is fixed when the order is placed
+        # and time_left is read off the book's clock
+        self.book = book
         self.total_time = duration
-        self.time_left = duration
+        self.deadline = (book.tick if book else 0) + duration
+        self.open = True
         
         # Calculate max score (50 pts per ingredient)
-        self.max_score = len(self.ingredients) * 50
+        self.max_score = len(self.contents) * 50
 
-    def update(self):
-        self.time_left -= 1
-        return self.time_left > 0 
+    @property
+    def time_left(self):
+        now = self.book.tick if self.book else 0
+        return self.deadline - now
 
 class OrderManager:
-    def __init__(self, level_config_recipes=None):
-        # Refresh Global Data to handle hot-reloads from Editor
-        global GAME_DATA
-        GAME_DATA = load_game_data()
+    def __init__(self, level_config_recipes=None, rng=None, timers=None, max_orders=DEFAULT_MAX_ORDERS):
+        # Edits from the Editor are picked up by gamedata.refresh() when the level loads
+        data = gamedata.get()
+
+        self.rng = rng or random # Seeded by Game so sessions replay exactly
+        self.tick = 0
+
+        # --- ORDER BOOK ---
+        # open_orders keeps arrival order (ticket order on screen), deadlines is a heap
+        # of (deadline, seq, order). Delivered orders are only flagged closed and get
+        # dropped when they reach the top of the heap, so both insert and expire are O(log n).
+        self.open_orders = {} # seq -> Order
+        self.deadlines = []
+        self.by_signature = {} # signature -> heap of (deadline, seq, order), for delivery matching
+        self.sequence = itertools.count()
+        self.max_orders = max_orders # None / 0 = no cap (rush-hour levels)
 
-        self.orders = []
         self.score = 0
         self.orders_completed = 0
-        self.spawn_timer = 0
+        self.version = 0 # Bumped whenever orders, score or completed count change (the UI caches on it)
         self.spawn_interval = 600 # 10 seconds
+
+        # Spawns run off a TimerScheduler; the Game passes its shared one and advances it
+        self.owns_timers = timers is None
+        self.timers = timers if timers is not None else TimerScheduler()
+        self.spawn_timer = self.timers.schedule(self.spawn_interval, self.spawn_due, repeat=self.spawn_interval)
         
         # 1. Get all valid recipes from Global Data
-        all_possible = list(GAME_DATA.get("recipes", {}).keys())
+        all_possible = list(data.recipes.keys())
         
         self.active_config = {}
         
-        # 2. Parse Level Config (Handle both Dict and List for backward compatibility)
-        if level_config_recipes and isinstance(level_config_recipes, dict):
-            # NEW FORMAT: { "soup": [1800, 3600], ... }
+        # 2. Parse Level Config: { "soup": [1800, 3600], ... } (old name lists are migrated by datacache)
+        level_config_recipes = datacache.normalise_recipes(level_config_recipes)
+        if level_config_recipes:
             for name, rng in level_config_recipes.items():
                 if name in all_possible:
                     self.active_config[name] = rng
-        
-        elif level_config_recipes and isinstance(level_config_recipes, list):
-            # OLD FORMAT: ["soup", "steak"]
-            for name in level_config_recipes:
-                if name in all_possible:
-                    self.active_config[name] = [1800, 2400] # Default range
         else:
             # FALLBACK: Enable everything
             for name in all_possible:
-                self.active_config[name] = [1800, 2400]
+                self.active_config[name] = list(datacache.DEFAULT_RECIPE_TIME)
             
         self.available_recipes = list(self.active_config.keys())
         print(f"DEBUG: Active Recipes: {self.available_recipes}")
+        self.apply_data(data)
+
+    def apply_data(self, data):
+        """Indexes just this level's recipes (plates and the UI hint use it). Also used by hot reload."""
+        self.recipe_index = RecipeIndex((name, data.recipe(name).codes) for name in self.available_recipes)
+
+    @property
+    def orders(self):
+        """Open orders, oldest first."""
+        return list(self.open_orders.values())
+
+    def page(self, index, per_page):
+        """Open orders index*per_page .. (index+1)*per_page, oldest first."""
+        start = index * per_page
+        return list(itertools.islice(self.open_orders.values(), start, start + per_page))
 
     def update(self):
-        # Update existing orders
-        for order in self.orders[:]:
-            if not order.update():
-                self.orders.remove(order)
-                self.score -= 50
-                print("Order Expired! -50 pts")
-
-        # Spawn new orders
-        self.spawn_timer += 1
-        if self.spawn_timer >= self.spawn_interval:
-            self.spawn_timer = 0
-            if len(self.orders) < 5: 
-                self.spawn_new_order()
+        self.tick += 1
+
+        # Expire everything whose deadline passed, only looks at the due end of the heap
+        deadlines = self.deadlines
+        while deadlines and deadlines[0][0] <= self.tick:
+            _, _, order = heapq.heappop(deadlines)
+            if not order.open: continue # Already delivered
+            self.close(order)
+            self.score -= 50
+            self.version += 1
+            print("Order Expired! -50 pts")
+
+        if self.owns_timers: self.timers.advance()
+
+    def close(self, order):
+        order.open = False
+        del self.open_orders[order.seq]
+        self.version += 1
+
+        # Drop closed orders off the top of their signature heap. Expiry goes in deadline
+        # order, so closed entries never pile up below an open one for long.
+        matching = self.by_signature.get(order.signature)
+        while matching and not matching[0][2].open:
+            heapq.heappop(matching)
+        if matching is not None and not matching:
+            del self.by_signature[order.signature]
+
+    def spawn_due(self):
+        if not self.max_orders or len(self.open_orders) < self.max_orders:
+            self.spawn_new_order()
 
     def spawn_new_order(self):
         if not self.available_recipes: return
         
-        name = random.choice(self.available_recipes)
+        name = self.rng.choice(self.available_recipes)
         
         # LOOK UP RANGE AND RANDOMIZE DURATION
         time_range = self.active_config.get(name, [1800, 1800])
-        duration = random.randint(time_range[0], time_range[1])
+        duration = self.rng.randint(time_range[0], time_range[1])
         
-        new_order = Order(name, duration=duration)
-        self.orders.append(new_order)
+        new_order = Order(name, duration=duration, book=self)
+        new_order.seq = next(self.sequence)
+        self.open_orders[new_order.seq] = new_order
+        entry = (new_order.deadline, new_order.seq, new_order)
+        heapq.heappush(self.deadlines, entry)
+        heapq.heappush(self.by_signature.setdefault(new_order.signature, []), entry)
+        self.version += 1
         print(f"New Order: {name} (Time: {duration})")
 
     def check_delivery(self, plate_contents):
         """
-        Checks if the list of ingredients on the plate matches any active order.
+        Checks if the plate contents (symbol codes) match any active order.
+        If several do, the one closest to expiring is served.
         """
-        plate_sorted = sorted(plate_contents)
+        matching = self.by_signature.get(recipe_signature(plate_contents))
 
-        for order in self.orders:
-            recipe_sorted = sorted(order.ingredients)
+        if matching:
+            # MATCH FOUND! (close() keeps the top of the heap open)
+            order = matching[0][2]
+            # Calculate Tip based on speed
+            percentage = order.time_left / order.total_time
+            tip = int(percentage * 20)
+            points = order.max_score + tip
             
-            if plate_sorted == recipe_sorted:
-                # MATCH FOUND!
-                # Calculate Tip based on speed
-                percentage = order.time_left / order.total_time
-                tip = int(percentage * 20)
-                points = order.max_score + tip
-                
-                self.score += points
-                self.orders_completed += 1
-                self.orders.remove(order)
-                print(f"Order Complete! +{points} pts")
-                return True 
+            self.score += points
+            self.orders_completed += 1
+            self.close(order) # Its deadline heap entry is skipped when it comes up (and bumps version)
+            print(f"Order Complete! +{points} pts")
+            return True 
         
         # No match found
         print("Wrong Order! -10 pts")
         self.score -= 10
+        self.version += 1
         return False
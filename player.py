@@ -1,5 +1,6 @@
 import pygame
 import controls
+from spatial import collide_sprite
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, x, y):
@@ -25,7 +26,7 @@ class Player(pygame.sprite.Sprite):
             self.facing = pygame.math.Vector2(1, 0)
             
         self.rect.x += move_x
-        hits = pygame.sprite.spritecollide(self, obstacles, False)
+        hits = collide_sprite(self, obstacles)
         for wall in hits:
             if move_x > 0: self.rect.right = wall.rect.left
             elif move_x < 0: self.rect.left = wall.rect.right
@@ -38,7 +39,7 @@ class Player(pygame.sprite.Sprite):
             self.facing = pygame.math.Vector2(0, 1)
             
         self.rect.y += move_y
-        hits = pygame.sprite.spritecollide(self, obstacles, False)
+        hits = collide_sprite(self, obstacles)
         for wall in hits:
             if move_y > 0: self.rect.bottom = wall.rect.top
             elif move_y < 0: self.rect.top = wall.rect.bottom
@@ -61,6 +62,7 @@ class Player(pygame.sprite.Sprite):
         self.inventory = item
         # FIX: Update physics_state, NOT state (which is for cooking)
         item.physics_state = "HELD"
+        item.moved()
 
     def drop(self):
         if self.inventory:
@@ -70,6 +72,7 @@ class Player(pygame.sprite.Sprite):
             
             drop_zone = self.get_interaction_hitbox()
             item.rect.center = drop_zone.center
+            item.moved()
             self.inventory = None
 
     def throw(self):
@@ -79,4 +82,5 @@ class Player(pygame.sprite.Sprite):
             item.velocity = self.facing * throw_speed
             # FIX: Update physics_state
             item.physics_state = "FLYING"
+            item.moved()
             self.inventory = None
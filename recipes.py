@@ -0,0 +1,40 @@
+import itertools
+from collections import Counter
+
+class RecipeIndex:
+    """
+    Answers "what can this partial plate still become?" for every recipe in gamedata.
+    Ingredients can be anything hashable and sortable (the game uses symbol codes).
+    Every sub-multiset of every recipe is worked out once, up front, and filed under
+    its sorted-tuple signature together with the ingredients it is still missing.
+    A query is then one dict lookup, however many recipes the game has.
+    (Recipes are a handful of ingredients, so the table stays small.)
+    """
+    def __init__(self, recipes=()):
+        self.partials = {} # partial signature -> list of (recipe name, missing ingredients)
+        self.recipe_count = 0
+        for name, ingredients in recipes:
+            self.add_recipe(name, ingredients)
+
+    def add_recipe(self, name, ingredients):
+        counts = sorted(Counter(ingredients).items())
+        # Every way of taking 0..n copies of each ingredient
+        for taken in itertools.product(*(range(n + 1) for _, n in counts)):
+            have, missing = [], []
+            for (ing, n), k in zip(counts, taken):
+                have += [ing] * k
+                missing += [ing] * (n - k)
+            key = tuple(have)
+            self.partials.setdefault(key, []).append((name, tuple(missing)))
+        self.recipe_count += 1
+
+    def matches(self, contents):
+        """[(recipe name, missing ingredients)] for every recipe the contents can still complete."""
+        return list(self.partials.get(tuple(sorted(contents)), ()))
+
+    def achievable(self, contents):
+        return tuple(sorted(contents)) in self.partials
+
+    def can_add(self, contents, ingredient):
+        """True if adding ingredient still leaves some recipe reachable."""
+        return self.achievable(list(contents) + [ingredient])
@@ -0,0 +1,222 @@
+import os
+import sys
+import json
+import struct
+import hashlib
+import argparse
+import pygame
+import controls
+from game import Game, TICKS_PER_SECOND
+import simulation
+from gamedata import DATA_FILE
+
+# --- FILE FORMAT ---
+# MAGIC, then one JSON header line, then run-length encoded ticks:
+#   struct RUN = (tick_count, held_mask, pressed_mask)
+# Bits in the masks index into header["actions"]. A run with tick_count 0
+# ends the stream and is followed by one JSON footer line with the result.
+MAGIC = b"UCREPLAY1\n"
+RUN = struct.Struct("<IHH")
+MAX_RUN = 2 ** 32 - 1
+
+def file_hash(path):
+    if not os.path.exists(path): return None
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+class SessionRecorder:
+    """
+    Streams a session to disk while it is played: seed, level, data hashes and
+    the action state of every logic tick. Attach with game.recorder = SessionRecorder(path, game)
+    before the first update and call close() when the session ends.
+    """
+    def __init__(self, path, game):
+        self.path = path
+        self.actions = list(controls.manager.actions.keys())
+        self.bits = {action: 1 << i for i, action in enumerate(self.actions)}
+        self.run_state = None
+        self.run_length = 0
+
+        header = {
+            "seed": game.seed,
+            "level": game.level_path,
+            "level_sha1": file_hash(game.level_path),
+            "gamedata_sha1": file_hash(DATA_FILE),
+            "tick_rate": TICKS_PER_SECOND,
+            "actions": self.actions,
+        }
+        self.file = open(path, 'wb')
+        self.file.write(MAGIC)
+        self.file.write(json.dumps(header).encode("utf-8") + b"\n")
+
+    def record_tick(self, keys, pressed):
+        held = 0
+        for action in self.actions:
+            if controls.manager.is_active(action, keys): held |= self.bits[action]
+        pressed_mask = 0
+        for action in pressed:
+            pressed_mask |= self.bits[action]
+
+        state = (held, pressed_mask)
+        if state == self.run_state and self.run_length < MAX_RUN:
+            self.run_length += 1
+        else:
+            self.flush()
+            self.run_state = state
+            self.run_length = 1
+
+    def flush(self):
+        if self.run_length:
+            self.file.write(RUN.pack(self.run_length, *self.run_state))
+            self.run_length = 0
+
+    def close(self, game=None):
+        if self.file.closed: return
+        self.flush()
+        self.file.write(RUN.pack(0, 0, 0))
+        footer = {}
+        if game is not None:
+            footer = {
+                "ticks": game.ticks,
+                "score": game.order_manager.score,
+                "orders_completed": game.order_manager.orders_completed,
+            }
+        self.file.write(json.dumps(footer).encode("utf-8") + b"\n")
+        self.file.close()
+
+class Replay:
+    """A recorded session. Also usable as an input source for simulation.run_headless()."""
+    def __init__(self, header, runs, footer):
+        self.header = header
+        self.runs = runs # [(tick_count, held_actions, pressed_actions)]
+        self.footer = footer
+        self.seed = header["seed"]
+        self.level = header["level"]
+        self.total_ticks = sum(run[0] for run in runs)
+        self.run_index = 0
+        self.run_end = runs[0][0] if runs else 0
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a replay file")
+            header = json.loads(f.readline())
+            actions = header["actions"]
+
+            def unpack(mask):
+                return tuple(action for i, action in enumerate(actions) if mask & (1 << i))
+
+            runs = []
+            footer = {}
+            while True:
+                chunk = f.read(RUN.size)
+                if len(chunk) < RUN.size: break # Recording was cut short (crash), keep what we have
+                count, held, pressed = RUN.unpack(chunk)
+                if count == 0:
+                    footer = json.loads(f.readline() or b"{}")
+                    break
+                runs.append((count, unpack(held), unpack(pressed)))
+        return cls(header, runs, footer)
+
+    def check_data(self):
+        """Warns if the level or gamedata changed since recording, the replay would diverge."""
+        ok = True
+        if file_hash(self.level) != self.header.get("level_sha1"):
+            print(f"WARNING: {self.level} changed since this session was recorded")
+            ok = False
+        if file_hash(DATA_FILE) != self.header.get("gamedata_sha1"):
+            print(f"WARNING: {DATA_FILE} changed since this session was recorded")
+            ok = False
+        return ok
+
+    def next_input(self, game, tick):
+        if tick == 0:
+            self.run_index = 0
+            self.run_end = self.runs[0][0] if self.runs else 0
+        while self.run_index < len(self.runs) and tick >= self.run_end:
+            self.run_index += 1
+            if self.run_index < len(self.runs): self.run_end += self.runs[self.run_index][0]
+        if self.run_index >= len(self.runs):
+            return (), ()
+        _, held, pressed = self.runs[self.run_index]
+        return held, pressed
+
+    def matches(self, game):
+        """True if the game ended where the recording did (only known for cleanly closed recordings)."""
+        if not self.footer: return None
+        return (self.footer.get("ticks") == game.ticks
+                and self.footer.get("score") == game.order_manager.score
+                and self.footer.get("orders_completed") == game.order_manager.orders_completed)
+
+def record_session(level_path, out_path, seed=None):
+    """Plays a level normally (with a window) while recording it."""
+    game = Game(level_path, seed=seed)
+    game.recorder = SessionRecorder(out_path, game)
+    try:
+        game.run()
+    finally:
+        game.recorder.close(game)
+    return game
+
+def play_replay(path, render=False, speed=1):
+    """
+    Feeds a recording back through Game. Headless replays run as fast as the CPU allows;
+    rendered ones run `speed` logic ticks per displayed frame.
+    """
+    replay = Replay.load(path)
+    replay.check_data()
+
+    if not render:
+        game = Game(replay.level, headless=True, seed=replay.seed)
+        simulation.run_headless(replay.level, replay, replay.total_ticks, game=game)
+    else:
+        game = Game(replay.level, seed=replay.seed)
+        clock = pygame.time.Clock()
+        tick = 0
+        while game.running and tick < replay.total_ticks and not game.game_over:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT: game.running = False
+            for _ in range(speed):
+                if tick >= replay.total_ticks or game.game_over: break
+                held, pressed = replay.next_input(game, tick)
+                simulation.step(game, held, pressed)
+                tick += 1
+            game.draw()
+            clock.tick(TICKS_PER_SECOND)
+
+    result = replay.matches(game)
+    if result is True: print("Replay matches the recording.")
+    elif result is False: print("WARNING: Replay diverged from the recording!")
+    return game
+
+def main():
+    parser = argparse.ArgumentParser(description="Record or replay game sessions.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("record", help="Play a level and record it")
+    rec.add_argument("level")
+    rec.add_argument("out")
+    rec.add_argument("--seed", type=int)
+
+    play = sub.add_parser("play", help="Replay a recording")
+    play.add_argument("replay")
+    play.add_argument("--render", action="store_true", help="Show the replay in a window")
+    play.add_argument("--speed", type=int, default=1, help="Logic ticks per rendered frame")
+
+    args = parser.parse_args()
+    if args.command == "record":
+        game = record_session(args.level, args.out, args.seed)
+        print(f"Recorded {game.ticks} ticks to {args.out}")
+    else:
+        game = play_replay(args.replay, args.render, args.speed)
+        print(json.dumps({
+            "ticks": game.ticks,
+            "score": game.order_manager.score,
+            "orders_completed": game.order_manager.orders_completed,
+        }, indent=4))
+    pygame.quit()
+    sys.exit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+import json
+import time
+import random
+import argparse
+import controls
+from game import Game, TICKS_PER_SECOND
+
+DEFAULT_MAX_TICKS = TICKS_PER_SECOND * 60 * 10 # 10 simulated minutes
+
+class ScriptedInput:
+    """
+    Plays back a fixed list of per-tick inputs.
+    Each step is None (no input) or {"held": [actions], "pressed": [actions]}.
+    "held" is what would be down on the keyboard, "pressed" are one-shot KEYDOWNs.
+    After the script runs out, no keys are pressed.
+    """
+    def __init__(self, steps=None):
+        self.steps = steps or []
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r') as f:
+            return cls(json.load(f))
+
+    def next_input(self, game, tick):
+        if tick >= len(self.steps) or not self.steps[tick]:
+            return (), ()
+        step = self.steps[tick]
+        return step.get("held", ()), step.get("pressed", ())
+
+class RandomBot:
+    """
+    Scripted bot that wanders and mashes buttons. Deterministic for a given seed.
+    Useful as a baseline policy for batch balancing runs.
+    """
+    MOVES = ["move_left", "move_right", "move_up", "move_down", "chop"]
+
+    def __init__(self, seed=0, hold_ticks=15, interact_chance=0.08, throw_chance=0.01):
+        self.rng = random.Random(seed)
+        self.hold_ticks = hold_ticks
+        self.interact_chance = interact_chance
+        self.throw_chance = throw_chance
+        self.held = ()
+
+    def next_input(self, game, tick):
+        if tick % self.hold_ticks == 0:
+            self.held = tuple(self.rng.sample(self.MOVES, self.rng.randint(0, 2)))
+        pressed = []
+        if self.rng.random() < self.interact_chance: pressed.append("interact")
+        if self.rng.random() < self.throw_chance: pressed.append("throw")
+        return self.held, pressed
+
+def step(game, held=(), pressed=()):
+    """Advances a headless game by exactly one logic tick. Presses are applied at the start of the tick."""
+    for action in pressed:
+        game.handle_action(action)
+        if not game.running: return
+    if not game.game_over:
+        game.update(controls.ActionState(held))
+
+def run_headless(level_path, input_source=None, max_ticks=DEFAULT_MAX_TICKS, game=None):
+    """
+    Runs a level with no display and no drawing, as fast as the CPU allows.
+    Stops after max_ticks, on game over, or when the input pauses/quits.
+    Returns the final score, completed orders and per-tick timings (seconds).
+    """
+    if game is None:
+        game = Game(level_path, headless=True)
+    if input_source is None:
+        input_source = ScriptedInput()
+
+    tick_times = []
+    tick = 0
+    while tick < max_ticks and game.running and not game.game_over:
+        held, pressed = input_source.next_input(game, tick)
+        start = time.perf_counter()
+        step(game, held, pressed)
+        tick_times.append(time.perf_counter() - start)
+        tick += 1
+
+    return {
+        "level": level_path,
+        "score": game.order_manager.score,
+        "orders_completed": game.order_manager.orders_completed,
+        "ticks": tick,
+        "game_over": game.game_over,
+        "tick_times": tick_times,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a level headless and print the result.")
+    parser.add_argument("level", help="Path to a level .json file")
+    parser.add_argument("--ticks", type=int, default=DEFAULT_MAX_TICKS, help="Maximum ticks to simulate")
+    parser.add_argument("--script", help="JSON file with per-tick scripted input")
+    args = parser.parse_args()
+
+    source = ScriptedInput.load(args.script) if args.script else None
+    result = run_headless(args.level, source, args.ticks)
+    times = result.pop("tick_times")
+    if times:
+        result["avg_tick_ms"] = round(1000 * sum(times) / len(times), 4)
+        result["max_tick_ms"] = round(1000 * max(times), 4)
+    print(json.dumps(result, indent=4))
+
+if __name__ == "__main__":
+    main()
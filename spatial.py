@@ -0,0 +1,112 @@
+import pygame
+
+# Must match Level.tile_size and map_editor.GRID_SIZE
+GRID_SIZE = 40
+
+class SpatialGroup(pygame.sprite.Group):
+    """
+    Sprite group that also files every sprite under the grid cells its rect covers.
+    Collision lookups only look at the few cells a rect overlaps, so their cost
+    does not grow with the number of sprites in the group.
+    Sprites are indexed on add/remove; one that moves must call relocate().
+    """
+    def __init__(self, *sprites, cell_size=GRID_SIZE):
+        self.cell_size = cell_size
+        self.cells = {} # (col, row) -> list of sprites
+        self.sprite_cells = {} # sprite -> cells it is filed under
+        super().__init__(*sprites)
+
+    def cells_for(self, rect):
+        size = self.cell_size
+        left = rect.left // size
+        top = rect.top // size
+        right = max(rect.left, rect.right - 1) // size
+        bottom = max(rect.top, rect.bottom - 1) // size
+        return [(col, row) for row in range(top, bottom + 1) for col in range(left, right + 1)]
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self._file(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self._unfile(sprite)
+
+    def _file(self, sprite):
+        cells = self.cells_for(sprite.rect)
+        self.sprite_cells[sprite] = cells
+        for cell in cells:
+            self.cells.setdefault(cell, []).append(sprite)
+
+    def _unfile(self, sprite):
+        for cell in self.sprite_cells.pop(sprite, ()):
+            bucket = self.cells[cell]
+            bucket.remove(sprite)
+            if not bucket: del self.cells[cell]
+
+    def relocate(self, sprite):
+        """Re-file a sprite after it moved (or otherwise changed how it is indexed)."""
+        if self.has_internal(sprite):
+            self._unfile(sprite)
+            self._file(sprite)
+
+    def at(self, x, y):
+        """Sprites filed under the cell containing point (x, y)."""
+        return list(self.cells.get((x // self.cell_size, y // self.cell_size), ()))
+
+    def collide(self, rect):
+        """Same result as spritecollide() against this group, without scanning it."""
+        hits = {}
+        for cell in self.cells_for(rect):
+            for sprite in self.cells.get(cell, ()):
+                if sprite not in hits and sprite.rect.colliderect(rect):
+                    hits[sprite] = True
+        return list(hits)
+
+class ItemGroup(SpatialGroup):
+    """
+    SpatialGroup for loose items. Resting (IDLE) items are filed on the grid.
+    Carried and flying items move every step, so instead of being re-filed they
+    sit in a small side table that is checked directly.
+    Items report physics_state / resting position changes via PhysicsEntity.moved().
+    """
+    def __init__(self, *sprites, cell_size=GRID_SIZE):
+        self.moving = {} # Ordered, keeps lookups deterministic for replays
+        self.recipe_index = None # The level's recipes.RecipeIndex, set by Game (see Plate.recipe_index)
+        super().__init__(*sprites, cell_size=cell_size)
+
+    def _file(self, sprite):
+        if getattr(sprite, "physics_state", "IDLE") != "IDLE":
+            self.moving[sprite] = True
+        else:
+            super()._file(sprite)
+
+    def _unfile(self, sprite):
+        self.moving.pop(sprite, None)
+        super()._unfile(sprite)
+
+    def collide(self, rect):
+        hits = super().collide(rect)
+        hits.extend(sprite for sprite in self.moving if sprite.rect.colliderect(rect))
+        return hits
+
+def nearest_interactable(hitbox, stations, items):
+    """
+    Returns the station or item the interaction hitbox points at: whichever
+    overlapping object is closest to the hitbox centre. If that turns out to be
+    a carried or flying item, nothing is selected.
+    """
+    hits = stations.collide(hitbox) + items.collide(hitbox)
+    if not hits: return None
+
+    interaction_point = pygame.math.Vector2(hitbox.center)
+    closest = min(hits, key=lambda obj: interaction_point.distance_to(obj.rect.center))
+    if getattr(closest, "physics_state", "IDLE") != "IDLE":
+        return None
+    return closest
+
+def collide_sprite(sprite, group):
+    """pygame.sprite.spritecollide(sprite, group, False), using the grid index when the group has one."""
+    if isinstance(group, SpatialGroup):
+        return group.collide(sprite.rect)
+    return pygame.sprite.spritecollide(sprite, group, False)
@@ -0,0 +1,37 @@
+import pygame
+
+# --- SHARED SPRITE SURFACES ---
+# Sprites that look alike share one Surface instead of each painting its own.
+# Keys are (type, variant, state, highlight). A sprite changing state just points
+# its image at another key, the pixels are painted once per key.
+#
+# Painters are plain functions paint(key) -> Surface; they also paint the
+# highlight=True look (usually with_border()).
+# Surfaces handed out here are SHARED: never draw on them. To get a modified look,
+# ask for another key or copy first.
+
+HIGHLIGHT_COLOR = (255, 255, 100)
+
+CACHE = {}
+
+def get(key, paint):
+    """The surface for key, made by paint(key) the first time it is asked for."""
+    surface = CACHE.get(key)
+    if surface is None:
+        surface = paint(key)
+        CACHE[key] = surface
+    return surface
+
+def highlighted(key, paint):
+    """The highlight=True version of key."""
+    return get(key[:3] + (True,), paint)
+
+def with_border(key, paint):
+    """For painters: a copy of the normal look of key with the yellow selection border."""
+    surface = get(key[:3] + (False,), paint).copy()
+    pygame.draw.rect(surface, HIGHLIGHT_COLOR, surface.get_rect(), 2)
+    return surface
+
+def clear():
+    """Drops every cached surface (gamedata hot reload). Sprites keep what they hold until they redraw."""
+    CACHE.clear()
@@ -0,0 +1,55 @@
+from array import array
+
+# --- CONTENT SYMBOLS ---
+# Everything that can sit in a pot or on a plate is an (ingredient, state) pair.
+# Each pair is interned once as a small int and contents are kept as compact
+# array('H') rows of those ints. Recipes, orders and deliveries compare ints,
+# string names are only produced when something has to be shown on screen.
+#
+# The table is append-only and shared by the whole process, so codes stay valid
+# across gamedata hot reloads. Codes are NOT stable between processes: never
+# save them to disk (the datacache stores names, see gamedata.GameData).
+
+class SymbolTable:
+    def __init__(self):
+        self.ids = {} # content name -> code
+        self.names = [] # code -> content name
+        self.pairs = {} # (ingredient, state) -> code
+
+    def intern(self, name):
+        code = self.ids.get(name)
+        if code is None:
+            code = len(self.names)
+            self.ids[name] = code
+            self.names.append(name)
+        return code
+
+    def code(self, ingredient, state="raw"):
+        """Code for an ingredient in a given state."""
+        code = self.pairs.get((ingredient, state))
+        if code is None:
+            code = self.intern(content_name(ingredient, state))
+            self.pairs[(ingredient, state)] = code
+        return code
+
+    def encode(self, names):
+        return array('H', [self.intern(name) for name in names])
+
+    def decode(self, codes):
+        return [self.names[code] for code in codes]
+
+    def display(self, code):
+        """Human readable form, e.g. "Onion chopped"."""
+        return self.names[code].replace("_", " ").capitalize()
+
+def content_name(ingredient, state):
+    # Recipes list chopped items as "<name>_chopped", raw and cooked items by plain name
+    # (a pot of onions and a cooked patty are both just the ingredient)
+    if state == "chopped": return ingredient + "_chopped"
+    return ingredient
+
+def contents():
+    """An empty contents row."""
+    return array('H')
+
+SYMBOLS = SymbolTable()
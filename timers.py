@@ -0,0 +1,60 @@
+import heapq
+import itertools
+
+class Timer:
+    """Handle for a scheduled callback, returned by TimerScheduler.schedule()."""
+    __slots__ = ("due", "callback", "args", "repeat", "cancelled")
+
+    def __init__(self, due, callback, args, repeat):
+        self.due = due
+        self.callback = callback
+        self.args = args
+        self.repeat = repeat
+        self.cancelled = False
+
+class TimerScheduler:
+    """
+    Runs callbacks once a given number of logic ticks has passed.
+    Timers sit in a heap ordered by due tick, so advancing a tick only looks at
+    the timers that are actually due instead of counting every one down.
+    Shared by the live game loop and headless runs (it counts ticks, not seconds).
+    """
+    def __init__(self):
+        self.tick = 0
+        self.heap = []
+        self.sequence = itertools.count() # Ties fire in scheduling order (deterministic replays)
+        self.pending = 0
+
+    def schedule(self, delay, callback, *args, repeat=None):
+        """Calls callback(*args) after `delay` ticks, then every `repeat` ticks if given."""
+        timer = Timer(self.tick + max(1, int(delay)), callback, args, repeat)
+        heapq.heappush(self.heap, (timer.due, next(self.sequence), timer))
+        self.pending += 1
+        return timer
+
+    def cancel(self, timer):
+        # Lazy removal: the heap entry is skipped when it comes due
+        if timer is not None and not timer.cancelled:
+            timer.cancelled = True
+            self.pending -= 1
+
+    def time_left(self, timer):
+        return max(0, timer.due - self.tick)
+
+    def advance(self, ticks=1):
+        """Moves time forward and fires everything that came due, in due order."""
+        self.tick += ticks
+        heap = self.heap
+        while heap and heap[0][0] <= self.tick:
+            _, _, timer = heapq.heappop(heap)
+            if timer.cancelled: continue
+            if timer.repeat:
+                timer.due += timer.repeat
+                heapq.heappush(heap, (timer.due, next(self.sequence), timer))
+            else:
+                self.pending -= 1
+                timer.cancelled = True # Spent, cancel() is now a no-op
+            timer.callback(*timer.args)
+
+    def __len__(self):
+        return self.pending
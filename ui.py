@@ -1,28 +1,78 @@
 import pygame
-import json
-import os
+import objects
+import gamedata
+from symbols import SYMBOLS
+from fonts import get_font, render_text
 
-GAME_DATA = {}
-if os.path.exists('gamedata.json'):
-    try:
-        with open('gamedata.json', 'r') as f:
-            GAME_DATA = json.load(f)
-    except:
-        pass
+TICKET_WIDTH = 90
+TICKET_HEIGHT = 90
+TICKET_PADDING = 10
+TICKET_PAGE_TICKS = 240 # Show each page of tickets for 4 seconds
 
 class UIManager:
-    def __init__(self, order_manager, game=None):
+    def __init__(self, order_manager, game=None, refresh_ticks=1):
         self.order_manager = order_manager
-        self.font = pygame.font.SysFont("Arial", 20, bold=True)
-        self.small_font = pygame.font.SysFont("Arial", 14)
-        self.info_font = pygame.font.SysFont("Arial", 18)
-        self.large_font = pygame.font.SysFont("Arial", 48, bold=True)
+        self.font = get_font("Arial", 20, bold=True)
+        self.small_font = get_font("Arial", 14)
+        self.info_font = get_font("Arial", 18)
+        self.large_font = get_font("Arial", 48, bold=True)
         self.game = game
         
         # UI Area Height (Must match game.py)
         self.height = 120 
+        self.last_bar_state = None
+        self.refresh_ticks = refresh_ticks # Unforced bar redraws at most once per this many order ticks
+        self.last_draw_tick = None
+
+        # --- RETAINED PIECES ---
+        # The bar is put together from cached surfaces that are only repainted when
+        # the version counters they depend on move (OrderManager.version, Game.version,
+        # gamedata registry version). Only the ticket time bars are drawn every time.
+        self.tickets = {} # order seq -> ticket surface, time bar left empty
+        self.tickets_stamp = None
+        self.score_box = None
+        self.score_stamp = None
+        self.timer_box = None
+        self.timer_stamp = None
+        self.overlay = None # Game over dimming layer
+
+    def ticket_page(self, screen_w):
+        """
+        The tickets that fit in the top bar at once. When the book holds more,
+        pages rotate on the order clock. Returns (page, page_count, orders).
+        """
+        # Tickets run from x=20 up to the score box (150 wide at the right edge)
+        per_page = max(1, (screen_w - 170) // (TICKET_WIDTH + TICKET_PADDING))
+        pages = max(1, -(-len(self.order_manager.open_orders) // per_page))
+        page = (self.order_manager.tick // TICKET_PAGE_TICKS) % pages
+        return page, pages, self.order_manager.page(page, per_page)
+
+    def bar_state(self, screen_w):
+        """Everything the top bar's pixels depend on. If this is unchanged, so is the bar."""
+        page, pages, visible = self.ticket_page(screen_w)
+        orders = []
+        for order in visible:
+            pct = max(0, order.time_left / order.total_time)
+            bar_w = pygame.Rect(0, 0, (TICKET_WIDTH - 10) * pct, 1).width
+            orders.append((id(order), order.recipe_name, bar_w, pct < 0.5, pct < 0.2))
+        timer = None
+        if self.game: timer = (int(self.game.game_timer), self.game.game_over)
+        return (self.order_manager.score, self.order_manager.orders_completed, timer, page, pages, tuple(orders))
+
+    def draw(self, screen, force=True):
+        """
+        Draws the top bar. With force=False nothing is drawn unless the bar changed
+        since the last call, and at most once every refresh_ticks order ticks.
+        Returns the screen rects that were redrawn.
+        """
+        tick = self.order_manager.tick
+        if not force and self.last_draw_tick is not None and tick - self.last_draw_tick < self.refresh_ticks:
+            return [] # Lower UI rate, see game.UI_FPS
+        state = self.bar_state(screen.get_width())
+        if not force and state == self.last_bar_state: return []
+        self.last_bar_state = state
+        self.last_draw_tick = tick
 
-    def draw(self, screen):
         # Draw Background Panel for Top Bar
         pygame.draw.rect(screen, (40, 40, 40), (0, 0, screen.get_width(), self.height))
         pygame.draw.line(screen, (255, 255, 255), (0, self.height - 2), (screen.get_width(), self.height - 2), 2)
@@ -33,6 +83,8 @@ class UIManager:
         
         if self.game and self.game.game_over:
             self.draw_game_over(screen)
+            return [screen.get_rect()]
+        return [pygame.Rect(0, 0, screen.get_width(), self.height)]
 
 
     def draw_selection_info(self, screen, obj, screen_h):
@@ -51,8 +103,8 @@ class UIManager:
 
         # Show contents for containers
         if hasattr(target, "contents") and len(target.contents) > 0:
-            # Clean up list strings
-            clean_contents = [c.replace("_", " ").capitalize() for c in target.contents]
+            # Symbol codes to readable names
+            clean_contents = [SYMBOLS.display(c) for c in target.contents]
             # Truncate if too long
             details_str = ", ".join(clean_contents)
             if len(details_str) > 20: details_str = details_str[:20] + "..."
@@ -65,7 +117,7 @@ class UIManager:
         text = f"Selected: {name}{details}"
         
         # Draw at BOTTOM of the ACTUAL screen (overlaying the game)
-        text_surf = self.info_font.render(text, True, (255, 255, 255))
+        text_surf = render_text(self.info_font, text, (255, 255, 255))
         rect = text_surf.get_rect(center=(screen.get_width() // 2, screen_h - 40))
         
         bg_rect = rect.inflate(20, 10)
@@ -74,7 +126,46 @@ class UIManager:
         
         screen.blit(text_surf, rect)
 
+        # Recipe hint for a plate that is being built up
+        hint = self.recipe_hint(target)
+        if hint:
+            hint_text, hint_color = hint
+            hint_surf = render_text(self.small_font, hint_text, hint_color)
+            hint_rect = hint_surf.get_rect(center=(screen.get_width() // 2, bg_rect.bottom + 12))
+            hint_bg = hint_rect.inflate(12, 4)
+            pygame.draw.rect(screen, (0, 0, 0), hint_bg)
+            screen.blit(hint_surf, hint_rect)
+            bg_rect = bg_rect.union(hint_bg)
+        return bg_rect
+
+    def recipe_hint(self, target):
+        """(text, color) telling what a partly filled plate can still become, or None."""
+        if not isinstance(target, objects.Plate) or target.is_dirty or not target.contents:
+            return None
+
+        # Same index the plate accepts ingredients by: this level's recipes only
+        options = self.order_manager.recipe_index.matches(target.contents)
+        if not options:
+            return "No recipe matches", (255, 80, 80)
+
+        options.sort(key=lambda m: len(m[1]))
+        name, missing = options[0]
+        if not missing:
+            text = f"Ready: {name.capitalize()}"
+        else:
+            needs = ", ".join(SYMBOLS.names[code].replace("_", " ") for code in missing)
+            text = f"{name.capitalize()} needs {needs}"
+        if len(options) > 1: text += f" (+{len(options) - 1} more)"
+        return text, (200, 255, 200)
+
     def draw_score(self, screen):
+        stamp = (self.order_manager.version, self.game.version if self.game else None)
+        if stamp != self.score_stamp:
+            self.score_box = self.paint_score()
+            self.score_stamp = stamp
+        screen.blit(self.score_box, (screen.get_width() - 150, 40))
+
+    def paint_score(self):
         text = f"Score: {self.order_manager.score}"
         
         if self.game and self.game.game_mode == "order_limit":
@@ -86,17 +177,15 @@ class UIManager:
             # Just show score, no extra text
             pass
             
-        text_surf = self.font.render(text, True, (255, 255, 255))
-        
-        x_pos = screen.get_width() - 150
-        y_pos = 40
+        text_surf = render_text(self.font, text, (255, 255, 255))
         
         # Adjust width if needed for longer text? 130 should be okay for "Orders Left: 99"
         # "Score: 9999" is roughly same width.
-        
-        pygame.draw.rect(screen, (0,0,0), (x_pos, y_pos, 150, 40)) # Slightly wider for "Orders Left"
-        pygame.draw.rect(screen, (255, 255, 255), (x_pos, y_pos, 150, 40), 2)
-        screen.blit(text_surf, (x_pos + 10, y_pos + 8))
+        box = pygame.Surface((150, 40))
+        pygame.draw.rect(box, (0,0,0), (0, 0, 150, 40)) # Slightly wider for "Orders Left"
+        pygame.draw.rect(box, (255, 255, 255), (0, 0, 150, 40), 2)
+        box.blit(text_surf, (10, 8))
+        return box
 
     def draw_timer(self, screen):
         if not self.game: return
@@ -111,7 +200,16 @@ class UIManager:
         elif self.game.game_mode == "endless":
             color = (255, 255, 255) # Always white for endless
             
-        text_surf = self.font.render(time_text, True, color)
+        # Repainted when the shown second or colour changes, not every frame
+        stamp = (time_text, color)
+        if stamp != self.timer_stamp:
+            text_surf = render_text(self.font, time_text, color)
+            box = pygame.Surface(text_surf.get_rect().inflate(20, 10).size)
+            box.fill((0, 0, 0))
+            pygame.draw.rect(box, (255, 255, 255), box.get_rect(), 2)
+            box.blit(text_surf, (10, 5))
+            self.timer_box = box
+            self.timer_stamp = stamp
         
         # Position below score
         # Score is at: x = screen.get_width() - 150, y = 40, w = 150, h = 40
@@ -124,76 +222,56 @@ class UIManager:
         timer_x = score_x + (score_w // 2)
         timer_y = score_y + score_h + 15
         
-        rect = text_surf.get_rect(center=(timer_x, timer_y))
-        
-        # BG
-        bg_rect = rect.inflate(20, 10)
-        pygame.draw.rect(screen, (0, 0, 0), bg_rect)
-        pygame.draw.rect(screen, (255, 255, 255), bg_rect, 2)
-        screen.blit(text_surf, rect)
+        bg_rect = screen.blit(self.timer_box, self.timer_box.get_rect(center=(timer_x, timer_y)))
         
         # If Order Limit, show goal
         if self.game.game_mode == "order_limit":
              goal = self.game.game_config.get("order_goal", 20)
              curr = self.order_manager.orders_completed
              goal_text = f"{curr} / {goal}"
-             goal_surf = self.small_font.render(goal_text, True, (200, 200, 200))
+             goal_surf = render_text(self.small_font, goal_text, (200, 200, 200))
              screen.blit(goal_surf, (bg_rect.centerx - goal_surf.get_width()//2, bg_rect.bottom + 5))
 
     def draw_game_over(self, screen):
         w, h = screen.get_width(), screen.get_height()
-        overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        if self.overlay is None or self.overlay.get_size() != (w, h):
+            self.overlay = pygame.Surface((w, h), pygame.SRCALPHA)
+            self.overlay.fill((0, 0, 0, 180))
+        screen.blit(self.overlay, (0, 0))
         
         msg = "LEVEL COMPLETE!"
         color = (0, 255, 0)
         
-        text_surf = self.large_font.render(msg, True, color)
+        text_surf = render_text(self.large_font, msg, color)
         rect = text_surf.get_rect(center=(w // 2, h // 2 - 50))
         screen.blit(text_surf, rect)
         
         # Score / Stars logic could go here
         score = self.order_manager.score
-        score_text = self.font.render(f"Final Score: {score}", True, (255, 255, 255))
+        score_text = render_text(self.font, f"Final Score: {score}", (255, 255, 255))
         screen.blit(score_text, score_text.get_rect(center=(w // 2, h // 2 + 10)))
         
-        hint = self.small_font.render("Press ESC to Quit", True, (200, 200, 200))
+        hint = render_text(self.small_font, "Press ESC to Quit", (200, 200, 200))
         screen.blit(hint, hint.get_rect(center=(w // 2, h // 2 + 50)))
 
     def draw_tickets(self, screen):
         start_x = 20
         start_y = 10
-        ticket_w = 90
-        ticket_h = 90 
-        padding = 10
+        ticket_w = TICKET_WIDTH
+        ticket_h = TICKET_HEIGHT
+        padding = TICKET_PADDING
 
-        for order in self.order_manager.orders:
-            rect = pygame.Rect(start_x, start_y, ticket_w, ticket_h)
-            
-            # Ticket Background
-            pygame.draw.rect(screen, (240, 240, 220), rect)
-            pygame.draw.rect(screen, (0, 0, 0), rect, 2)
-
-            # Name
-            name_text = self.small_font.render(order.recipe_name[:12], True, (0,0,0))
-            screen.blit(name_text, (start_x + 5, start_y + 5))
-
-            # Icons
-            icon_y = start_y + 25
-            icon_x = start_x + 5
-            for ing in order.ingredients:
-                ing_data = GAME_DATA.get("ingredients", {}).get(ing, {})
-                color = tuple(ing_data.get("color_raw", (100, 100, 100)))
-                pygame.draw.circle(screen, color, (icon_x + 10, icon_y + 10), 8)
-                pygame.draw.circle(screen, (0,0,0), (icon_x + 10, icon_y + 10), 8, 1)
-                
-                icon_x += 20
-                if icon_x > start_x + ticket_w - 20:
-                    icon_x = start_x + 5
-                    icon_y += 20
-
-            # Time Bar
+        page, pages, visible = self.ticket_page(screen.get_width())
+        if pages > 1:
+            # Page indicator under the tickets, e.g. "Orders 1/3 (14)"
+            total = len(self.order_manager.open_orders)
+            page_surf = render_text(self.small_font, f"Orders {page + 1}/{pages} ({total})", (200, 200, 200))
+            screen.blit(page_surf, (start_x, start_y + ticket_h + 1))
+
+        for order in visible:
+            screen.blit(self.ticket(order), (start_x, start_y))
+
+            # Time Bar, the only live part of a ticket
             bar_h = 8
             bar_y = start_y + ticket_h - 12
             pct = order.time_left / order.total_time
@@ -203,7 +281,55 @@ class UIManager:
             if pct < 0.5: bar_color = (255, 255, 0)
             if pct < 0.2: bar_color = (255, 0, 0)
 
-            pygame.draw.rect(screen, (50,50,50), (start_x + 5, bar_y, ticket_w - 10, bar_h))
             pygame.draw.rect(screen, bar_color, (start_x + 5, bar_y, (ticket_w - 10) * pct, bar_h))
 
             start_x += ticket_w + padding
+
+    def ticket(self, order):
+        """The cached ticket surface for an order (everything but the time bar fill)."""
+        stamp = (self.order_manager.version, gamedata.REGISTRY.version)
+        if stamp != self.tickets_stamp:
+            # Drop tickets of closed orders; new colours after a gamedata reload repaint all
+            if self.tickets_stamp and self.tickets_stamp[1] != stamp[1]: self.tickets.clear()
+            open_orders = self.order_manager.open_orders
+            for seq in [seq for seq in self.tickets if seq not in open_orders]: del self.tickets[seq]
+            self.tickets_stamp = stamp
+
+        surface = self.tickets.get(order.seq)
+        if surface is None:
+            surface = self.paint_ticket(order)
+            self.tickets[order.seq] = surface
+        return surface
+
+    def paint_ticket(self, order):
+        ticket_w = TICKET_WIDTH
+        ticket_h = TICKET_HEIGHT
+        surface = pygame.Surface((ticket_w, ticket_h))
+        rect = surface.get_rect()
+        
+        # Ticket Background
+        pygame.draw.rect(surface, (240, 240, 220), rect)
+        pygame.draw.rect(surface, (0, 0, 0), rect, 2)
+
+        # Name
+        name_text = render_text(self.small_font, order.recipe_name[:12], (0,0,0))
+        surface.blit(name_text, (5, 5))
+
+        # Icons
+        icon_y = 25
+        icon_x = 5
+        ingredients = gamedata.get().ingredients
+        for code in order.contents:
+            ing_data = ingredients.get(SYMBOLS.names[code])
+            color = ing_data.color_raw if ing_data else (100, 100, 100)
+            pygame.draw.circle(surface, color, (icon_x + 10, icon_y + 10), 8)
+            pygame.draw.circle(surface, (0,0,0), (icon_x + 10, icon_y + 10), 8, 1)
+            
+            icon_x += 20
+            if icon_x > ticket_w - 20:
+                icon_x = 5
+                icon_y += 20
+
+        # Empty time bar
+        pygame.draw.rect(surface, (50,50,50), (5, ticket_h - 12, ticket_w - 10, 8))
+        return surface